@@ -5,98 +5,307 @@ This module provides base classes and decorators for API operations
 including error handling, logging, and response formatting.
 """
 
-from typing import Any, Dict, Callable
+import hashlib
+import logging
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, Callable, List, Optional, Sequence, Tuple, Union
 from functools import wraps
+from uuid import UUID
+
+import orjson
 
 from core.logger import logger
 from core.exceptions import ApplicationError, ValidationError, DatabaseConnectionError
 
 
-class APIResponse:
-    """Standard API response format."""
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+FilterKey = Tuple[Tuple[str, Any], ...]
+
+
+def freeze_filters(filters: Optional[Dict[str, Any]]) -> Optional[FilterKey]:
+    """
+    Convert a filter dictionary into a deterministic, hashable cache key.
     
-    @staticmethod
-    def success(data: Any, message: str = "Success") -> Dict[str, Any]:
-        """
-        Create a success response.
+    Args:
+        filters: Optional dictionary of filters (column: value)
         
-        Args:
-            data: Response data
-            message: Success message
-            
-        Returns:
-            Formatted response dictionary
-        """
-        return {
-            "success": True,
-            "message": message,
-            "data": data
-        }
-    
-    @staticmethod
-    def error(message: str, details: Dict[str, Any] = None) -> Dict[str, Any]:
-        """
-        Create an error response.
+    Returns:
+        Sorted tuple of (column, value) pairs, or None if there are no filters
+    """
+    if not filters:
+        return None
+    return tuple(sorted(filters.items()))
+
+
+def filter_records(records: List[Dict[str, Any]], filters: Optional[FilterKey]) -> List[Dict[str, Any]]:
+    """
+    Filter cached records in memory using a frozen filter key.
+    
+    Values are compared as strings so that IDs passed as text match
+    numeric columns, mirroring the database's equality filter.
+    
+    Args:
+        records: Records to filter
+        filters: Frozen filters as returned by freeze_filters
         
-        Args:
-            message: Error message
-            details: Optional error details
-            
-        Returns:
-            Formatted error dictionary
-        """
-        return {
-            "success": False,
-            "message": message,
-            "details": details or {}
-        }
+    Returns:
+        Records matching every filter
+    """
+    if not filters:
+        return records
+    
+    expected = [(column, str(value)) for column, value in filters]
+    return [
+        record for record in records
+        if all(str(record.get(column)) == value for column, value in expected)
+    ]
 
 
-def handle_api_errors(func: Callable) -> Callable:
+def _default(obj: Any) -> Any:
     """
-    Decorator to handle API errors consistently.
+    Fallback serializer for types orjson does not handle natively.
     
     Args:
-        func: Function to wrap
+        obj: Object to serialize
         
     Returns:
-        Wrapped function with error handling
+        JSON-compatible representation of the object
+        
+    Raises:
+        TypeError: If the object type is not supported
     """
-    @wraps(func)
-    def wrapper(*args, **kwargs):
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, UUID):
+        return str(obj)
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def cache_key_hash(value: Any) -> bytes:
+    """
+    Hash a cache argument through its canonical orjson encoding.
+    
+    Keys are sorted so equal dictionaries hash the same regardless of
+    insertion order.
+    
+    Args:
+        value: Dictionary or tuple passed to a cached function
+        
+    Returns:
+        16-byte digest identifying the value
+    """
+    encoded = orjson.dumps(
+        value,
+        option=_ORJSON_OPTIONS | orjson.OPT_SORT_KEYS | orjson.OPT_NAIVE_UTC,
+        default=_default
+    )
+    return hashlib.blake2b(encoded, digest_size=16).digest()
+
+
+# hash_funcs for st.cache_data on functions taking filter dicts/tuples
+CACHE_HASH_FUNCS = {dict: cache_key_hash, tuple: cache_key_hash}
+
+
+def project_columns(columns: Optional[Sequence[str]], filters: Optional[FilterKey]) -> Optional[Tuple[str, ...]]:
+    """
+    Build a hashable column projection that also covers the filtered columns.
+    
+    Args:
+        columns: Requested columns, or None for all columns
+        filters: Frozen filters as returned by freeze_filters
+        
+    Returns:
+        Tuple of columns to select, or None to select all
+    """
+    if not columns:
+        return None
+    projected = tuple(columns)
+    if filters:
+        projected += tuple(column for column, _ in filters if column not in projected)
+    return projected
+
+
+def page_records(records: List[Dict[str, Any]], limit: Optional[int] = None,
+                 offset: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Apply limit/offset pagination to records already held in memory.
+    
+    Args:
+        records: Records to paginate
+        limit: Optional maximum number of records to return
+        offset: Optional number of records to skip
+        
+    Returns:
+        The requested page of records
+    """
+    start = offset or 0
+    if limit is None:
+        return records[start:] if start else records
+    return records[start:start + limit]
+
+
+@dataclass(slots=True)
+class OkResponse:
+    """Successful API response."""
+    
+    data: Any
+    message: str = "Success"
+    success: bool = True
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dictionary-style access kept for callers written against the old dict responses."""
+        return getattr(self, key, default)
+    
+    def __getitem__(self, key: str) -> Any:
         try:
-            return func(*args, **kwargs)
-        except ValidationError as e:
-            logger.warning(f"Validation error in {func.__name__}: {e.message}")
-            return APIResponse.error(e.message, e.details)
-        except DatabaseConnectionError as e:
-            logger.error(f"Database error in {func.__name__}: {e.message}")
-            return APIResponse.error("Database connection failed. Please try again.", e.details)
-        except ApplicationError as e:
-            logger.error(f"Application error in {func.__name__}: {e.message}")
-            return APIResponse.error(e.message, e.details)
-        except Exception as e:
-            logger.exception(f"Unexpected error in {func.__name__}")
-            return APIResponse.error("An unexpected error occurred. Please contact support.")
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+
+@dataclass(slots=True)
+class ErrResponse:
+    """Failed API response."""
+    
+    message: str
+    details: Dict[str, Any] = field(default_factory=dict)
+    success: bool = False
     
-    return wrapper
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dictionary-style access kept for callers written against the old dict responses."""
+        return getattr(self, key, default)
+    
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+
+Response = Union[OkResponse, ErrResponse]
+
+
+def _ok(data: Any, message: str = "Success") -> OkResponse:
+    """
+    Create a success response.
+    
+    Args:
+        data: Response data
+        message: Success message
+        
+    Returns:
+        Success response
+    """
+    return OkResponse(data, message)
 
 
-def log_api_call(func: Callable) -> Callable:
+def _err(message: str, details: Dict[str, Any] = None) -> ErrResponse:
     """
-    Decorator to log API calls.
+    Create an error response.
     
     Args:
-        func: Function to wrap
+        message: Error message
+        details: Optional error details
         
     Returns:
-        Wrapped function with logging
+        Error response
+    """
+    return ErrResponse(message, details or {})
+
+
+class APIResponse:
+    """Standard API response format."""
+    
+    success = staticmethod(_ok)
+    error = staticmethod(_err)
+
+
+# Exceptions translated into error responses unless an endpoint narrows them
+DEFAULT_CATCHES: Tuple[type, ...] = (ValidationError, DatabaseConnectionError, ApplicationError)
+
+
+def _error_response(func_name: str, error: Exception) -> ErrResponse:
     """
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        logger.info(f"API call: {func.__name__}")
-        result = func(*args, **kwargs)
-        logger.info(f"API call completed: {func.__name__}")
-        return result
+    Log an exception raised by an API function and convert it to a response.
     
-    return wrapper
+    Args:
+        func_name: Name of the failing function
+        error: Raised exception
+        
+    Returns:
+        Error response
+    """
+    if isinstance(error, ValidationError):
+        logger.warning(f"Validation error in {func_name}: {error.message}")
+        return _err(error.message, error.details)
+    if isinstance(error, DatabaseConnectionError):
+        logger.error(f"Database error in {func_name}: {error.message}")
+        return _err("Database connection failed. Please try again.", error.details)
+    if isinstance(error, ApplicationError):
+        logger.error(f"Application error in {func_name}: {error.message}")
+        return _err(error.message, error.details)
+    return _unexpected_error(func_name)
+
+
+def _unexpected_error(func_name: str) -> ErrResponse:
+    """
+    Log an unexpected exception and return a generic error response.
+    
+    Must be called from within an except block so the traceback is logged.
+    
+    Args:
+        func_name: Name of the failing function
+        
+    Returns:
+        Error response
+    """
+    logger.exception(f"Unexpected error in {func_name}")
+    return _err("An unexpected error occurred. Please contact support.")
+
+
+def api_endpoint(log_calls: bool = False,
+                 catches: Tuple[type, ...] = DEFAULT_CATCHES) -> Callable[[Callable], Callable]:
+    """
+    Decorator combining error handling and optional call logging in one wrapper.
+    
+    Caching is done by the module-level fetchers each endpoint calls, so
+    cache hits pay for a single wrapper frame instead of a decorator stack.
+    Keep st.cache_data on the fetchers rather than around this wrapper:
+    cached error responses would otherwise be served until the TTL expires.
+    
+    Args:
+        log_calls: Log entry and exit at DEBUG level (used for mutating endpoints)
+        catches: Application exceptions the endpoint can raise; anything
+            else is reported as an unexpected error
+        
+    Returns:
+        Decorator producing the wrapped endpoint
+    """
+    # Under python -O the logger level is fixed at decoration time
+    log_calls = log_calls and (__debug__ or logger.isEnabledFor(logging.DEBUG))
+    
+    def decorator(func: Callable) -> Callable:
+        name = func.__name__
+        
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            debug = log_calls and logger.isEnabledFor(logging.DEBUG)
+            try:
+                if debug:
+                    logger.debug(f"API call: {name}")
+                result = func(*args, **kwargs)
+                if debug:
+                    logger.debug(f"API call completed: {name}")
+                return result
+            except catches as e:
+                return _error_response(name, e)
+            except Exception:
+                return _unexpected_error(name)
+        
+        return wrapper
+    return decorator
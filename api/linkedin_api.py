@@ -5,17 +5,59 @@ This module provides API functions for managing LinkedIn campaigns
 and leads.
 """
 
-from typing import List, Dict, Optional, Any
+from functools import lru_cache
+from typing import List, Dict, Optional, Any, Sequence, Tuple
 
 import streamlit as st
 
 from core.database import get_database_client
+from core.exceptions import DatabaseConnectionError
 from core.validators import validate_campaign_id, validate_required_fields
 from core.logger import logger
-from api.base import handle_api_errors, log_api_call, APIResponse
+from api.base import (
+    _ok, api_endpoint, CACHE_HASH_FUNCS, FilterKey, Response,
+    filter_records, freeze_filters, page_records, project_columns
+)
 import config
 
 
+@st.cache_data(ttl=config.CACHE_TTL_CAMPAIGNS, hash_funcs=CACHE_HASH_FUNCS)
+def _fetch_campaigns(
+    table_name: str,
+    filters: Optional[FilterKey] = None,
+    columns: Optional[Tuple[str, ...]] = None,
+    limit: Optional[int] = None,
+    offset: Optional[int] = None
+) -> List[Dict]:
+    """Fetch LinkedIn campaigns, cached per table, filter set, projection and page."""
+    return get_database_client().fetch_all(
+        table_name, filters, columns, limit, offset
+    )
+
+
+@st.cache_data(ttl=config.CACHE_TTL_CAMPAIGNS, hash_funcs=CACHE_HASH_FUNCS)
+def _fetch_campaign(table_name: str, campaign_id: str) -> Dict:
+    """Fetch a single LinkedIn campaign, cached per table and ID."""
+    return get_database_client().fetch_by_id(table_name, 'campaign_id', campaign_id)
+
+
+@st.cache_data(ttl=config.CACHE_TTL_LEADS, hash_funcs=CACHE_HASH_FUNCS)
+def _cached_all_leads(table_name: str, columns: Optional[Tuple[str, ...]] = None) -> List[Dict]:
+    """Fetch every LinkedIn lead once per projection; filtered reads are served from this copy."""
+    return get_database_client().fetch_all(table_name, columns=columns)
+
+
+@lru_cache(maxsize=256)
+def _leads_filter_key(campaign_id: Optional[str], status: Optional[str]) -> Optional[FilterKey]:
+    """Build the frozen lead filters for a (campaign_id, status) pair once."""
+    filters = []
+    if status:
+        filters.append(('Status', status))
+    if campaign_id:
+        filters.append(('campaign_id', campaign_id))
+    return tuple(filters) or None
+
+
 class LinkedInCampaignAPI:
     """API handler for LinkedIn campaign operations."""
     
@@ -25,26 +67,34 @@ class LinkedInCampaignAPI:
         self.campaigns_table = config.LINKEDIN_CAMPAIGN_TABLE_NAME
         self.leads_table = config.LINKEDIN_LEADS_TABLE_NAME
     
-    @st.cache_data(ttl=config.CACHE_TTL)
-    @handle_api_errors
-    @log_api_call
-    def get_campaigns(_self, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    @api_endpoint(catches=(DatabaseConnectionError,))
+    def get_campaigns(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        columns: Optional[Sequence[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> Response:
         """
         Get all LinkedIn campaigns with optional filters.
         
         Args:
             filters: Optional dictionary of filters
+            columns: Optional subset of columns to return
+            limit: Optional maximum number of records to return
+            offset: Optional number of records to skip
             
         Returns:
             API response with list of campaigns
         """
-        campaigns = _self.db.fetch_all(_self.campaigns_table, filters)
-        return APIResponse.success(campaigns, f"Retrieved {len(campaigns)} campaigns")
+        campaigns = _fetch_campaigns(
+            self.campaigns_table, freeze_filters(filters),
+            tuple(columns) if columns else None, limit, offset
+        )
+        return _ok(campaigns, f"Retrieved {len(campaigns)} campaigns")
     
-    @st.cache_data(ttl=config.CACHE_TTL)
-    @handle_api_errors
-    @log_api_call
-    def get_campaign_by_id(_self, campaign_id: str) -> Dict[str, Any]:
+    @api_endpoint()
+    def get_campaign_by_id(self, campaign_id: str) -> Response:
         """
         Get a specific LinkedIn campaign by ID.
         
@@ -55,12 +105,11 @@ class LinkedInCampaignAPI:
             API response with campaign data
         """
         campaign_id = validate_campaign_id(campaign_id)
-        campaign = _self.db.fetch_by_id(_self.campaigns_table, 'campaign_id', campaign_id)
-        return APIResponse.success(campaign, "Campaign retrieved successfully")
+        campaign = _fetch_campaign(self.campaigns_table, campaign_id)
+        return _ok(campaign, "Campaign retrieved successfully")
     
-    @handle_api_errors
-    @log_api_call
-    def create_campaign(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    @api_endpoint(log_calls=True)
+    def create_campaign(self, data: Dict[str, Any]) -> Response:
         """
         Create a new LinkedIn campaign.
         
@@ -75,12 +124,11 @@ class LinkedInCampaignAPI:
         validate_required_fields(data, required_fields)
         
         campaign = self.db.insert(self.campaigns_table, data)
-        st.cache_data.clear()  # Clear cache after modification
-        return APIResponse.success(campaign, "Campaign created successfully")
+        _fetch_campaigns.clear()
+        return _ok(campaign, "Campaign created successfully")
     
-    @handle_api_errors
-    @log_api_call
-    def update_campaign(self, campaign_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    @api_endpoint(log_calls=True)
+    def update_campaign(self, campaign_id: str, data: Dict[str, Any]) -> Response:
         """
         Update an existing LinkedIn campaign.
         
@@ -93,12 +141,12 @@ class LinkedInCampaignAPI:
         """
         campaign_id = validate_campaign_id(campaign_id)
         campaign = self.db.update(self.campaigns_table, 'campaign_id', campaign_id, data)
-        st.cache_data.clear()  # Clear cache after modification
-        return APIResponse.success(campaign, "Campaign updated successfully")
+        _fetch_campaigns.clear()
+        _fetch_campaign.clear()
+        return _ok(campaign, "Campaign updated successfully")
     
-    @handle_api_errors
-    @log_api_call
-    def delete_campaign(self, campaign_id: str) -> Dict[str, Any]:
+    @api_endpoint(log_calls=True)
+    def delete_campaign(self, campaign_id: str) -> Response:
         """
         Delete a LinkedIn campaign and all associated leads.
         
@@ -110,44 +158,49 @@ class LinkedInCampaignAPI:
         """
         campaign_id = validate_campaign_id(campaign_id)
         
-        # Delete associated leads first
-        # self.db.delete_many(self.leads_table, {'campaign_id': campaign_id})
-        
-        # Delete the campaign
-        self.db.delete(self.campaigns_table, 'campaign_id', campaign_id)
+        # Leads and campaign are removed together in one transaction
+        self.db.delete_campaign_cascade(self.campaigns_table, self.leads_table, campaign_id)
         
-        st.cache_data.clear()  # Clear cache after modification
-        return APIResponse.success(
+        _fetch_campaigns.clear()
+        _fetch_campaign.clear()
+        _cached_all_leads.clear()
+        return _ok(
             {"campaign_id": campaign_id},
             "Campaign and associated leads deleted successfully"
         )
     
-    @st.cache_data(ttl=config.CACHE_TTL)
-    @handle_api_errors
-    @log_api_call
-    def get_leads(_self, campaign_id: Optional[str] = None, status: Optional[str] = None) -> Dict[str, Any]:
+    @api_endpoint(catches=(DatabaseConnectionError,))
+    def get_leads(
+        self,
+        campaign_id: Optional[str] = None,
+        status: Optional[str] = None,
+        columns: Optional[Sequence[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> Response:
         """
         Get LinkedIn leads, optionally filtered by campaign or status.
         
         Args:
             campaign_id: Optional campaign ID to filter by
             status: Optional status to filter by
+            columns: Optional subset of columns to return
+            limit: Optional maximum number of records to return
+            offset: Optional number of records to skip
             
         Returns:
             API response with list of leads
         """
-        filters = {}
-        if campaign_id:
-            filters['campaign_id'] = campaign_id
-        if status:
-            filters['Status'] = status
-        
-        leads = _self.db.fetch_all(_self.leads_table, filters or None)
-        return APIResponse.success(leads, f"Retrieved {len(leads)} leads")
+        filter_key = _leads_filter_key(campaign_id, status)
+        leads = filter_records(
+            _cached_all_leads(self.leads_table, project_columns(columns, filter_key)),
+            filter_key
+        )
+        leads = page_records(leads, limit, offset)
+        return _ok(leads, f"Retrieved {len(leads)} leads")
     
-    @handle_api_errors
-    @log_api_call
-    def update_lead(self, lead_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    @api_endpoint(log_calls=True)
+    def update_lead(self, lead_id: str, data: Dict[str, Any]) -> Response:
         """
         Update a LinkedIn lead.
         
@@ -159,12 +212,11 @@ class LinkedInCampaignAPI:
             API response with updated lead
         """
         lead = self.db.update(self.leads_table, 'id', lead_id, data)
-        st.cache_data.clear()  # Clear cache after modification
-        return APIResponse.success(lead, "Lead updated successfully")
+        _cached_all_leads.clear()
+        return _ok(lead, "Lead updated successfully")
     
-    @handle_api_errors
-    @log_api_call
-    def delete_lead(self, lead_id: str) -> Dict[str, Any]:
+    @api_endpoint(log_calls=True)
+    def delete_lead(self, lead_id: str) -> Response:
         """
         Delete a specific LinkedIn lead.
         
@@ -175,5 +227,16 @@ class LinkedInCampaignAPI:
             API response indicating success
         """
         self.db.delete(self.leads_table, 'id', lead_id)
-        st.cache_data.clear()  # Clear cache after modification
-        return APIResponse.success({"lead_id": lead_id}, "Lead deleted successfully")
+        _cached_all_leads.clear()
+        return _ok({"lead_id": lead_id}, "Lead deleted successfully")
+
+
+@st.cache_resource
+def get_linkedin_api() -> LinkedInCampaignAPI:
+    """
+    Get the process-wide LinkedIn campaign API instance.
+    
+    Returns:
+        Shared LinkedInCampaignAPI instance
+    """
+    return LinkedInCampaignAPI()
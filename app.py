@@ -7,10 +7,6 @@ Clean, modular architecture with separated concerns.
 
 import streamlit as st
 
-# Import shared utilities
-from shared.ui_components import load_css, render_platform_selector, render_refresh_button
-from components.api_key_manager import check_for_missing_keys
-
 # Page configuration
 st.set_page_config(
     page_title="📧 Email KPI Dashboard",
@@ -19,12 +15,16 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Load CSS from external file
-load_css()
-
 
 def main():
     """Main application entry point."""
+    from shared.ui_components import load_css, render_platform_selector, render_refresh_button, show_error
+    from components.api_key_manager import check_for_missing_keys
+    from core.exceptions import ApplicationError
+    from core.logger import logger
+    
+    # Load CSS from external file
+    load_css()
     
     # Check for missing API keys to show alert
     has_missing_keys = check_for_missing_keys()
@@ -33,26 +33,31 @@ def main():
     with st.sidebar:
         platform = render_platform_selector(show_api_alert=has_missing_keys)
     
-    # Route to appropriate dashboard based on platform selection
-    # Route to appropriate dashboard based on platform selection
-    if platform == "🔗 LinkedIn":
-        from linkedin.components.dashboard import render_linkedin_dashboard
-        render_linkedin_dashboard()
-    elif platform == "🔑 API Config":
-        from components.api_key_manager import render_api_key_manager
-        render_api_key_manager()
-    else:
-        from email_campaigns.components.dashboard import run_email_dashboard
-        run_email_dashboard()
+    # Route to appropriate dashboard based on platform selection.
+    # Database and other application errors that escape a page end up here.
+    try:
+        if platform == "🔗 LinkedIn":
+            from linkedin.components.dashboard import render_linkedin_dashboard
+            render_linkedin_dashboard()
+        elif platform == "🔑 API Config":
+            from components.api_key_manager import render_api_key_manager
+            render_api_key_manager()
+        else:
+            from email_campaigns.components.dashboard import run_email_dashboard
+            run_email_dashboard()
+    except ApplicationError as e:
+        logger.error(f"Unhandled application error on {platform}: {e.message}")
+        show_error(e.message, str(e.details) if e.details else None)
     
     # Refresh button in sidebar (Bottom)
     with st.sidebar:
         st.divider()
         render_refresh_button()
         
-        # Math Guide
-        from shared.guide import render_math_guide
-        render_math_guide()
+        # Math Guide (not relevant on the config page)
+        if platform not in ("🔑 API Config",):
+            from shared.guide import render_math_guide
+            render_math_guide()
 
 
 if __name__ == "__main__":
@@ -1,60 +1,224 @@
+from operator import itemgetter
+from typing import Dict, List, Set, Tuple
+
 import streamlit as st
 import pandas as pd
 from core.database import get_database_client
 from shared.ui_components import show_success, show_error
-from email_campaigns.data.repository import EmailRepository
-from config import EMAIL_API_KEYS_TABLE_NAME
+from email_campaigns.data.repository import get_email_repository
+from core.exceptions import DatabaseConnectionError
+from core.logger import logger
+from shared.concurrency import run_concurrently
+from config import CAMPAIGNS_TABLE_NAME, EMAIL_API_KEYS_TABLE_NAME
 
+# Columns of the API keys table the manager actually reads
+_KEY_COLUMNS = "id, workspace_id, workspace_name, api_key"
 
-def check_for_missing_keys() -> bool:
-    """
-    Check if there are any discovered workspaces without API keys.
-    Returns True if attention is needed.
+# api_key values that mean "not configured" (empty JSON object included)
+_INVALID_KEY_VALUES = frozenset({'', '{}', 'null', 'None'})
+
+# Lowercased workspace IDs that are placeholders, not real workspaces
+_INVALID_WS = frozenset({'', 'nan', 'unknown', 'none'})
+
+
+def _has_key(value) -> bool:
+    """Return True if an api_key column value holds a usable key."""
+    if value is None:
+        return False
+    return (value if isinstance(value, str) else str(value)).strip() not in _INVALID_KEY_VALUES
+
+
+def _discover_workspaces(campaigns: List[Dict]) -> Dict[str, str]:
     """
-    try:
-        db = get_database_client()
-        repo = EmailRepository()
-        
-        # 1. Get Discovered Workspaces
-        campaigns = repo.get_campaigns()
-        if not campaigns:
-            return False
-            
-        camp_df = pd.DataFrame(campaigns)
-        discovered_ids = set()
-        
-        if 'workspace_id' in camp_df.columns:
-            # Filter out None/Nan
-            discovered_ids = set(camp_df['workspace_id'].dropna().astype(str).unique())
+    Collect the workspaces referenced by campaigns in a single pass.
+    
+    Args:
+        campaigns: Campaign records
         
-        if not discovered_ids:
-            return False
-            
-        # 2. Get Configured Keys
-        # We only care about keys that are NOT null/empty
-        keys_response = db.client.table(EMAIL_API_KEYS_TABLE_NAME).select("workspace_id, api_key").execute()
-        configured_ids = set()
-        if keys_response.data:
-            for k in keys_response.data:
-                # Check if key is valid (not null/empty/{})
-                val = k.get('api_key')
-                if val and str(val).strip() != '{}':
-                    configured_ids.add(str(k.get('workspace_id')))
+    Returns:
+        Mapping of workspace_id (as string) to workspace name; the first
+        name seen for an ID wins. Campaigns with a name but no usable ID
+        are grouped under "UNKNOWN".
+    """
+    discovered = {}
+    for campaign in campaigns:
+        wid = campaign.get('workspace_id')
+        # Missing, blank or NaN (NaN != NaN) IDs, which the pandas path dropped
+        if wid is None or wid == '' or wid != wid:
+            if campaign.get('workspace_name') is None:
+                continue
+            wid = "UNKNOWN"
+        wid = str(wid)
+        if wid not in discovered:
+            discovered[wid] = campaign.get('workspace_name') or 'Unknown'
+    return discovered
+
+
+def _discover_workspace_ids(campaigns: List[Dict]) -> Set[str]:
+    """
+    Collect the usable workspace IDs referenced by campaigns.
+    
+    ID-only counterpart of _discover_workspaces for the missing-key check:
+    builds the set directly without the name mapping.
+    
+    Args:
+        campaigns: Campaign records
         
-        # 3. Check for missing
-        # If any discovered ID is NOT in configured IDs, return True
-        missing = discovered_ids - configured_ids
+    Returns:
+        Set of workspace IDs as strings (missing, blank and NaN IDs skipped)
+    """
+    wids = (campaign.get('workspace_id') for campaign in campaigns)
+    # NaN != NaN, so the last test drops NaN IDs
+    return {str(wid) for wid in wids if wid is not None and wid != '' and wid == wid}
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _build_master_list(discovered: Dict[str, str], existing_keys: List[Dict]) -> List[Dict]:
+    """
+    Outer-join discovered workspaces with the configured key rows.
+    
+    Cached, so reruns with unchanged data skip the merge and the sort.
+    
+    Args:
+        discovered: Mapping of workspace_id to name from _discover_workspaces
+        existing_keys: Key records from the API keys table
         
-        # Filter out "UNKNOWN" or empty strings if they strictly exist
-        missing = {x for x in missing if x and x != 'nan' and x.lower() != 'unknown' and x.lower() != 'none'}
+    Returns:
+        Rows with workspace_id, workspace_name, has_key, db_id and api_key,
+        sorted by workspace_name. Names from the keys table win, since they
+        are entered by hand.
+    """
+    master_list = {
+        wid: {
+            'workspace_id': wid,
+            'workspace_name': wname,
+            'has_key': False,
+            'db_id': None,
+            'api_key': None
+        }
+        for wid, wname in discovered.items()
+    }
+    
+    for key in existing_keys:
+        wid = str(key.get('workspace_id', 'UNKNOWN'))
+        current_api_val = key.get('api_key')
+        row = master_list.get(wid)
+        if row is None:
+            # Key exists but no campaigns found for it yet (maybe new workspace)
+            row = master_list[wid] = {'workspace_id': wid, 'workspace_name': 'Unknown'}
+        row['has_key'] = _has_key(current_api_val)
+        row['db_id'] = key.get('id')
+        row['api_key'] = current_api_val
+        if key.get('workspace_name'):
+            row['workspace_name'] = key.get('workspace_name')
+    
+    return sorted(master_list.values(), key=itemgetter('workspace_name'))
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_api_keys() -> List[Dict]:
+    """
+    Fetch the configured API key rows.
+    
+    Shared by the sidebar alert check and the manager page so a render of
+    the API Config page queries the keys table once.
+    
+    Returns:
+        List of key records with the _KEY_COLUMNS fields
+    """
+    db = get_database_client()
+    return db.client.table(EMAIL_API_KEYS_TABLE_NAME).select(_KEY_COLUMNS).execute().data or []
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_workspace_key_state() -> Tuple[Set[str], Set[str]]:
+    """
+    Fetch the workspace IDs seen in campaigns and those with a configured key.
+    
+    Returns:
+        Tuple of (discovered_ids, configured_ids)
+    """
+    # Cheap HEAD probe: with no campaigns there is nothing to discover
+    if get_database_client().count_rows(CAMPAIGNS_TABLE_NAME) == 0:
+        return set(), set()
+    
+    repo = get_email_repository()
+    
+    # Independent round trips: fetch campaigns and keys in parallel
+    campaigns, existing_keys = run_concurrently(repo.get_campaigns, _fetch_api_keys)
+    
+    # 1. Get Discovered Workspaces
+    if not campaigns:
+        return set(), set()
         
-        return len(missing) > 0
+    discovered_ids = _discover_workspace_ids(campaigns)
+    
+    if not discovered_ids:
+        return discovered_ids, set()
         
+    # 2. Get Configured Keys
+    # We only care about keys that are NOT null/empty
+    configured_ids = set()
+    for k in existing_keys:
+        if _has_key(k.get('api_key')):
+            configured_ids.add(str(k.get('workspace_id')))
+    
+    return discovered_ids, configured_ids
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _has_missing_keys() -> bool:
+    """
+    Check if any discovered workspace has no usable API key.
+    
+    Cached for a minute. Errors propagate instead of being turned into a
+    result, so a transient database failure is not cached.
+    
+    Raises:
+        DatabaseConnectionError: If the fallback queries fail
+    """
+    try:
+        return get_database_client().missing_api_keys_count(
+            CAMPAIGNS_TABLE_NAME, EMAIL_API_KEYS_TABLE_NAME
+        ) > 0
+    except DatabaseConnectionError as e:
+        # RPC not installed (migrations/003) or failed: compute it here
+        logger.warning(f"Falling back to client-side missing key check: {e}")
+    
+    discovered_ids, configured_ids = _fetch_workspace_key_state()
+    
+    # 3. Check for missing
+    # If any discovered ID is NOT in configured IDs, return True
+    missing = discovered_ids - configured_ids
+    
+    # Filter out "UNKNOWN" or empty strings if they strictly exist
+    missing = {x for x in missing if x.lower() not in _INVALID_WS}
+    
+    return len(missing) > 0
+
+
+def check_for_missing_keys() -> bool:
+    """
+    Check if there are any discovered workspaces without API keys.
+    Returns True if attention is needed.
+    
+    Runs on every page render (sidebar alert); the result is cached in
+    _has_missing_keys, and saving or deleting a key clears it.
+    """
+    try:
+        return _has_missing_keys()
     except Exception as e:
-        # If error, fail safe (don't show alert)
+        # If error, fail safe (don't show alert); retried on the next render
+        logger.warning(f"Missing API key check failed: {e}")
         return False
 
 
+def _clear_key_caches() -> None:
+    """Drop the cached key state after a key is saved or deleted."""
+    for cached in (_has_missing_keys, _fetch_api_keys, _fetch_workspace_key_state, _build_master_list):
+        cached.clear()
+
+
 def render_api_key_manager():
     """Render the API Key Management Interface"""
     
@@ -70,9 +234,6 @@ def render_api_key_manager():
     </div>
     """, unsafe_allow_html=True)
     
-    db = get_database_client()
-    table_name = EMAIL_API_KEYS_TABLE_NAME
-    
     # Initialize session state for editing
     if "edit_ws_id" not in st.session_state:
         st.session_state.edit_ws_id = ""
@@ -80,72 +241,39 @@ def render_api_key_manager():
     
     # --- Fetch Data ---
     with st.spinner("Loading Workspaces..."):
-        # 1. Get existing keys
+        repo = get_email_repository()
+        
+        # 1. Get existing keys and 2. campaigns (discovery) in parallel
         try:
-            keys_response = db.client.table(table_name).select("*").execute()
-            existing_keys = keys_response.data
-            keys_df = pd.DataFrame(existing_keys) if existing_keys else pd.DataFrame(columns=['workspace_id', 'workspace_name', 'api_key', 'id'])
+            existing_keys, campaigns = run_concurrently(_fetch_api_keys, repo.get_campaigns)
         except Exception as e:
             st.error(f"Error fetching keys: {e}")
             existing_keys = []
-            keys_df = pd.DataFrame()
-
-        # 2. Get Workspaces from Campaigns (Discovery)
-        repo = EmailRepository()
-        campaigns = repo.get_campaigns()
+            # get_campaigns handles its own errors; cached if it already finished
+            campaigns = repo.get_campaigns()
         
-        discovered_workspaces = []
-        if campaigns:
-            camp_df = pd.DataFrame(campaigns)
-            # Check for workspace columns
-            if 'workspace_id' in camp_df.columns and 'workspace_name' in camp_df.columns:
-                discovered_workspaces = camp_df[['workspace_id', 'workspace_name']].drop_duplicates().to_dict('records')
-            elif 'workspace_name' in camp_df.columns:
-                # Fallback if ID missing
-                discovered_workspaces = camp_df[['workspace_name']].drop_duplicates().to_dict('records')
-                for d in discovered_workspaces:
-                    d['workspace_id'] = "UNKNOWN"
+        discovered_workspaces = _discover_workspaces(campaigns) if campaigns else {}
         
         # Merge Discovered with Existing
-        # We want a master list of all workspaces (from DB keys OR from campaigns)
-        
-        master_list = {} # Key: workspace_id (or name if id missing)
-        
-        # Add discovered first
-        for ws in discovered_workspaces:
-            wid = str(ws.get('workspace_id', 'UNKNOWN'))
-            wname = ws.get('workspace_name', 'Unknown')
-            master_list[wid] = {
-                'workspace_id': wid,
-                'workspace_name': wname,
-                'has_key': False,
-                'db_id': None,
-                'api_key': None
-            }
-            
-        # Update with existing keys
-        for key in existing_keys:
-            wid = str(key.get('workspace_id', 'UNKNOWN'))
-            current_api_val = key.get('api_key')
-            has_api_key = bool(current_api_val and str(current_api_val).strip() != '{}')
-            
-            if wid in master_list:
-                master_list[wid]['has_key'] = has_api_key
-                master_list[wid]['db_id'] = key.get('id')
-                master_list[wid]['api_key'] = current_api_val
-                # Update name if DB has better name? Or keep campaign name?
-                # Usually DB config might be more manual/correct.
-                if key.get('workspace_name'):
-                     master_list[wid]['workspace_name'] = key.get('workspace_name')
-            else:
-                # Key exists but no campaigns found for it yet (maybe new workspace)
-                master_list[wid] = {
-                    'workspace_id': wid,
-                    'workspace_name': key.get('workspace_name', 'Unknown'),
-                    'has_key': has_api_key,
-                    'db_id': key.get('id'),
-                    'api_key': current_api_val
-                }
+        master_list = _build_master_list(discovered_workspaces, existing_keys)
+    
+    _render_key_editor(master_list)
+
+
+@st.fragment
+def _render_key_editor(master_list: List[Dict]) -> None:
+    """
+    Render the add/edit form and the workspace list.
+    
+    Runs as a fragment so clicking Edit / Add Key only reruns this block
+    instead of the whole page and its data fetch. Saving and deleting still
+    trigger a full rerun.
+    
+    Args:
+        master_list: Sorted workspace rows from _build_master_list
+    """
+    db = get_database_client()
+    table_name = EMAIL_API_KEYS_TABLE_NAME
     
     # --- Add/Edit Form ---
     # Determine if we are editing/adding based on session state or user action
@@ -166,30 +294,21 @@ def render_api_key_manager():
                     show_error("Workspace Name and ID are required")
                 else:
                     try:
-                        # Check if update or insert - query DB directly for robust check
-                        # Check if workspace_id already exists in the table
-                        check_res = db.client.table(table_name).select('id').eq('workspace_id', workspace_id).execute()
-                        
                         data = {
                             "workspace_name": workspace_name,
                             "workspace_id": workspace_id,
                             "api_key": api_key_input
                         }
                         
-                        if check_res.data:
-                            # Update existing record
-                            existing_id = check_res.data[0]['id']
-                            db.client.table(table_name).update(data).eq('id', existing_id).execute()
-                            show_success(f"Updated keys for {workspace_name}")
-                        else:
-                            # Insert new record
-                            db.client.table(table_name).insert(data).execute()
-                            show_success(f"Added keys for {workspace_name}")
+                        # Insert or update in one round trip (unique index on workspace_id)
+                        db.upsert(table_name, data, on_conflict='workspace_id')
+                        show_success(f"Saved keys for {workspace_name}")
                             
                         # Clear edit state
                         st.session_state.edit_ws_id = ""
                         st.session_state.edit_ws_name = ""
-                        st.cache_data.clear()
+                        _clear_key_caches()
+                        # Full rerun: the sidebar alert and the fetched list change
                         st.rerun()
                         
                     except Exception as e:
@@ -201,49 +320,42 @@ def render_api_key_manager():
     if not master_list:
         st.info("No workspaces found.")
     else:
-        # Sort by Name
-        sorted_ws = sorted(master_list.values(), key=lambda x: x['workspace_name'])
+        sorted_ws = master_list
         
-        # Headers
-        c1, c2, c3, c4 = st.columns([3, 2, 2, 3])
-        c1.markdown("**Workspace Name**")
-        c2.markdown("**ID**")
-        c3.markdown("**Status**")
-        c4.markdown("**Actions**")
-        st.divider()
+        # One table element instead of a row of columns/widgets per workspace
+        view_df = pd.DataFrame({
+            'Workspace Name': [item['workspace_name'] for item in sorted_ws],
+            'ID': [item['workspace_id'] for item in sorted_ws],
+            'Status': ["✅ Configured" if item['has_key'] else "⚠️ Missing Key" for item in sorted_ws],
+        })
+        st.dataframe(view_df, use_container_width=True, hide_index=True)
         
-        for item in sorted_ws:
-            c1, c2, c3, c4 = st.columns([3, 2, 2, 3])
-            
-            with c1:
-                st.write(item['workspace_name'])
-            with c2:
-                st.code(item['workspace_id'])
-            with c3:
-                if item['has_key']:
-                    st.success("✅ Configured")
-                else:
-                    st.warning("⚠️ Missing Key")
-                    
-            with c4:
-                # ACTION BUTTONS
-                col_a, col_b = st.columns(2)
-                with col_a:
-                    btn_label = "✏️ Edit" if item['has_key'] else "➕ Add Key"
-                    if st.button(btn_label, key=f"btn_edit_{item['workspace_id']}"):
-                        st.session_state.edit_ws_id = item['workspace_id']
-                        st.session_state.edit_ws_name = item['workspace_name']
+        # ACTIONS: a single workspace picker drives the edit/delete buttons
+        by_id = {item['workspace_id']: item for item in sorted_ws}
+        selected_id = st.selectbox(
+            "Workspace",
+            options=list(by_id),
+            format_func=lambda wid: f"{by_id[wid]['workspace_name']} ({wid})",
+            key="api_key_action_ws"
+        )
+        item = by_id[selected_id]
+        
+        col_a, col_b, _ = st.columns([1, 1, 4])
+        with col_a:
+            btn_label = "✏️ Edit" if item['has_key'] else "➕ Add Key"
+            if st.button(btn_label, key="btn_edit_selected", width="stretch"):
+                st.session_state.edit_ws_id = item['workspace_id']
+                st.session_state.edit_ws_name = item['workspace_name']
+                # Only the form's prefill changes; data is unchanged
+                st.rerun(scope="fragment")
+        
+        with col_b:
+            if item['has_key']:
+                if st.button("🗑️ Delete", key="btn_del_selected", help="Delete Configuration", width="stretch"):
+                    try:
+                        db.client.table(table_name).delete().eq("id", item['db_id']).execute()
+                        show_success("Deleted")
+                        _clear_key_caches()
                         st.rerun()
-                
-                with col_b:
-                    if item['has_key']:
-                        if st.button("🗑️", key=f"btn_del_{item['workspace_id']}", help="Delete Configuration"):
-                            try:
-                                db.client.table(table_name).delete().eq("id", item['db_id']).execute()
-                                show_success("Deleted")
-                                st.cache_data.clear()
-                                st.rerun()
-                            except Exception as e:
-                                show_error(f"Error: {e}")
-            
-            st.divider()
+                    except Exception as e:
+                        show_error(f"Error: {e}")
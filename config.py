@@ -27,3 +27,8 @@ PORT            = int(os.getenv("MODAL_PORT", "8000"))
 
 # Cache Configuration
 CACHE_TTL = 300  # 5 minutes
+
+# Per-table TTLs for the API layer, tuned to how often each table changes
+CACHE_TTL_CAMPAIGNS = 300  # Campaigns change rarely
+CACHE_TTL_LEADS = 30       # Leads are written continuously
+CACHE_TTL_SEQUENCES = 120
@@ -6,7 +6,7 @@ retry logic, and comprehensive error handling.
 """
 
 import os
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Sequence, Tuple, Union
 from functools import wraps
 import time
 
@@ -15,8 +15,12 @@ from supabase import create_client, Client
 
 from core.exceptions import DatabaseConnectionError, ResourceNotFoundError
 from core.logger import logger
+from core.singleflight import singleflight
 import config
 
+# Equality filters: a dictionary or an already-frozen sequence of (column, value) pairs
+Filters = Union[Dict[str, Any], Sequence[Tuple[str, Any]]]
+
 
 def retry_on_failure(max_retries: int = 3, delay: float = 1.0):
     """
@@ -95,14 +99,25 @@ class DatabaseClient:
             raise DatabaseConnectionError("Database client not initialized")
         return self._client
     
+    @singleflight
     @retry_on_failure(max_retries=3)
-    def fetch_all(self, table_name: str, filters: Optional[Dict[str, Any]] = None) -> List[Dict]:
+    def fetch_all(
+        self,
+        table_name: str,
+        filters: Optional[Filters] = None,
+        columns: Optional[Sequence[str]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None
+    ) -> List[Dict]:
         """
         Fetch all records from a table with optional filters.
         
         Args:
             table_name: Name of the table
-            filters: Optional dictionary of filters (column: value)
+            filters: Optional filters, as a dictionary or (column, value) pairs
+            columns: Optional subset of columns to select (defaults to all)
+            limit: Optional maximum number of records to return
+            offset: Optional number of records to skip
             
         Returns:
             List of records as dictionaries
@@ -110,17 +125,27 @@ class DatabaseClient:
         Raises:
             DatabaseConnectionError: If database operation fails
         """
+        # Empty page, as page_records returns; PostgREST rejects an inverted range
+        if limit is not None and limit <= 0:
+            return []
+        
         try:
             all_records = []
-            offset = 0
-            limit = 1000
+            select = ",".join(columns) if columns else "*"
+            filter_pairs = filters.items() if isinstance(filters, dict) else filters
+            start = offset or 0
+            page_size = 1000
             
             while True:
-                query = self.client.table(table_name).select("*").range(offset, offset + limit - 1)
+                end = start + page_size - 1
+                if limit is not None:
+                    end = min(end, (offset or 0) + limit - 1)
+                
+                query = self.client.table(table_name).select(select).range(start, end)
                 
                 # Apply filters if provided
                 if filters:
-                    for column, value in filters.items():
+                    for column, value in filter_pairs:
                         query = query.eq(column, value)
                 
                 response = query.execute()
@@ -131,10 +156,12 @@ class DatabaseClient:
                     
                 all_records.extend(data)
                 
-                if len(data) < limit:
+                if len(data) < end - start + 1:
+                    break
+                if limit is not None and len(all_records) >= limit:
                     break
                     
-                offset += limit
+                start += page_size
                 
             logger.debug(f"Fetched {len(all_records)} records from {table_name}")
             return all_records
@@ -179,6 +206,32 @@ class DatabaseClient:
             logger.error(error_msg)
             raise DatabaseConnectionError(error_msg)
     
+    @retry_on_failure(max_retries=3)
+    def count_rows(self, table_name: str) -> int:
+        """
+        Count the rows of a table without fetching them.
+        
+        Issues a HEAD request with an exact count, so only the count
+        header crosses the network.
+        
+        Args:
+            table_name: Name of the table
+            
+        Returns:
+            Number of rows
+            
+        Raises:
+            DatabaseConnectionError: If database operation fails
+        """
+        try:
+            response = self.client.table(table_name).select("*", count="exact", head=True).execute()
+            return response.count or 0
+            
+        except Exception as e:
+            error_msg = f"Error counting rows in {table_name}: {str(e)}"
+            logger.error(error_msg)
+            raise DatabaseConnectionError(error_msg)
+    
     @retry_on_failure(max_retries=3)
     def insert(self, table_name: str, data: Dict[str, Any]) -> Dict:
         """
@@ -231,6 +284,32 @@ class DatabaseClient:
             logger.error(error_msg)
             raise DatabaseConnectionError(error_msg)
     
+    @retry_on_failure(max_retries=3)
+    def upsert(self, table_name: str, data: Dict[str, Any], on_conflict: str) -> Dict:
+        """
+        Insert a record, or update the existing one on a unique-key conflict.
+        
+        Args:
+            table_name: Name of the table
+            data: Dictionary of column: value pairs
+            on_conflict: Column(s) of the unique constraint to resolve against
+            
+        Returns:
+            Inserted or updated record as dictionary
+            
+        Raises:
+            DatabaseConnectionError: If database operation fails
+        """
+        try:
+            response = self.client.table(table_name).upsert(data, on_conflict=on_conflict).execute()
+            logger.info(f"Upserted record in {table_name} on {on_conflict}")
+            return response.data[0] if response.data else {}
+            
+        except Exception as e:
+            error_msg = f"Error upserting into {table_name}: {str(e)}"
+            logger.error(error_msg)
+            raise DatabaseConnectionError(error_msg)
+    
     @retry_on_failure(max_retries=3)
     def delete(self, table_name: str, id_column: str, id_value: Any) -> bool:
         """
@@ -287,6 +366,73 @@ class DatabaseClient:
             logger.error(error_msg)
             raise DatabaseConnectionError(error_msg)
     
+    def delete_campaign_cascade(self, campaigns_table: str, leads_table: str, campaign_id: Any) -> bool:
+        """
+        Delete a campaign and its leads.
+        
+        Uses the delete_campaign_cascade Postgres function
+        (migrations/001_delete_campaign_cascade.sql), which runs both
+        deletes in one round trip and one transaction. The RPC is not
+        retried: if it fails (e.g. the migration is not applied), the leads
+        and then the campaign are deleted with two retried requests.
+        
+        Args:
+            campaigns_table: Name of the campaigns table
+            leads_table: Name of the leads table
+            campaign_id: ID of the campaign to delete
+            
+        Returns:
+            True if successful
+            
+        Raises:
+            DatabaseConnectionError: If database operation fails
+        """
+        try:
+            self.client.rpc('delete_campaign_cascade', {
+                'p_campaigns_table': campaigns_table,
+                'p_leads_table': leads_table,
+                'p_campaign_id': str(campaign_id),
+            }).execute()
+            logger.info(f"Deleted campaign {campaign_id} and its leads from {campaigns_table}/{leads_table}")
+            return True
+            
+        except Exception as e:
+            logger.warning(f"delete_campaign_cascade RPC failed, deleting leads and campaign separately: {e}")
+        
+        # delete_many/delete raise DatabaseConnectionError on failure
+        self.delete_many(leads_table, {'campaign_id': campaign_id})
+        return self.delete(campaigns_table, 'campaign_id', campaign_id)
+    
+    def missing_api_keys_count(self, campaigns_table: str, keys_table: str) -> int:
+        """
+        Count workspaces that have campaigns but no usable API key.
+        
+        Runs the missing_api_keys_count function (migrations/003) so only
+        the count crosses the network. Not retried: callers fall back to a
+        client-side check, and a missing function would only fail again.
+        
+        Args:
+            campaigns_table: Name of the campaigns table
+            keys_table: Name of the API keys table
+            
+        Returns:
+            Number of workspaces missing a key
+            
+        Raises:
+            DatabaseConnectionError: If database operation fails
+        """
+        try:
+            response = self.client.rpc('missing_api_keys_count', {
+                'p_campaigns_table': campaigns_table,
+                'p_keys_table': keys_table,
+            }).execute()
+            return int(response.data or 0)
+            
+        except Exception as e:
+            error_msg = f"Error counting missing API keys: {str(e)}"
+            logger.error(error_msg)
+            raise DatabaseConnectionError(error_msg)
+    
     def delete_linkedin_campaign(self, campaign_id: str) -> bool:
         """
         Delete a LinkedIn campaign. 
@@ -0,0 +1,90 @@
+"""
+Single-flight call coalescing.
+
+This module provides a decorator that collapses concurrent calls with the
+same arguments into one execution, so a burst of cache misses across
+sessions results in a single database round trip.
+"""
+
+import copy
+import threading
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class _Call:
+    """State of one in-flight call shared by the leader and its waiters."""
+    
+    __slots__ = ("event", "result", "error")
+    
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+_lock = threading.Lock()
+_inflight: Dict[Hashable, _Call] = {}
+
+
+def _freeze(value: Any) -> Hashable:
+    """Convert common unhashable argument types into hashable equivalents."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, set):
+        return frozenset(_freeze(item) for item in value)
+    return value
+
+
+def _make_key(name: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Hashable:
+    """Build the coalescing key for a call."""
+    return (name, _freeze(args), _freeze(kwargs))
+
+
+def singleflight(func: Callable) -> Callable:
+    """
+    Decorator coalescing concurrent calls with identical arguments.
+    
+    The first caller for a key executes the function; callers arriving
+    while it runs wait for it and receive a shallow copy of its result,
+    or the same exception if it failed. Nothing is retained once the
+    call completes, so this complements rather than replaces caching.
+    
+    Args:
+        func: Function to wrap
+        
+    Returns:
+        Wrapped function
+    """
+    name = f"{func.__module__}.{func.__qualname__}"
+    
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        key = _make_key(name, args, kwargs)
+        
+        with _lock:
+            call = _inflight.get(key)
+            leader = call is None
+            if leader:
+                call = _inflight[key] = _Call()
+        
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.copy(call.result)
+        
+        try:
+            call.result = func(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with _lock:
+                _inflight.pop(key, None)
+            call.event.set()
+    
+    return wrapper
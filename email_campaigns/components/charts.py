@@ -4,6 +4,9 @@ import plotly.graph_objects as go
 import pandas as pd
 import datetime
 import numpy as np
+
+from email_campaigns.services.esp_crosstab import esp_reply_crosstab
+
 # Modern Professional color palettes
 # Modern Professional color palettes - matching new reference
 # MODERN_BLUE_SEQ   = ['#6366F1', '#818CF8', '#A5B4FC', '#C7D2FE'] # Indigo
@@ -12,17 +15,17 @@ import numpy as np
 # MODERN_PURPLE_SEQ = ['#8B5CF6', '#A78BFA', '#C4B5FD', '#DDD6FE'] # Violet
 # MODERN_AMBER_SEQ  = ['#F59E0B', '#FBBF24', '#FCD34D', '#FDE68A'] # Amber
 # MODERN_ORANGE_SEQ = ['#F97316', '#FB923C', '#FDBA74', '#FFEDD5'] # Orange
-# Professional & Formal color palettes
-MODERN_BLUE_SEQ   = ['#1E40AF', '#3B82F6', '#93C5FD', '#DBEAFE']
-MODERN_GREEN_SEQ  = ['#065F46', '#10B981', '#6EE7B7', '#D1FAE5']
-MODERN_ROSE_SEQ   = ['#9F1239', '#F43F5E', '#FDA4AF', '#FFF1F2']
-MODERN_PURPLE_SEQ = ['#5B21B6', '#8B5CF6', '#C4B5FD', '#EDE9FE']
-MODERN_AMBER_SEQ  = ['#92400E', '#F59E0B', '#FCD34D', '#FEF3C7']
-FORMAL_GRAY_SEQ   = ['#334155', '#475569', '#64748B', '#94A3B8', '#CBD5E1', '#E2E8F0', '#F1F5F9']
+# Professional & Formal color palettes (tuples: shared, never mutated)
+MODERN_BLUE_SEQ   = ('#1E40AF', '#3B82F6', '#93C5FD', '#DBEAFE')
+MODERN_GREEN_SEQ  = ('#065F46', '#10B981', '#6EE7B7', '#D1FAE5')
+MODERN_ROSE_SEQ   = ('#9F1239', '#F43F5E', '#FDA4AF', '#FFF1F2')
+MODERN_PURPLE_SEQ = ('#5B21B6', '#8B5CF6', '#C4B5FD', '#EDE9FE')
+MODERN_AMBER_SEQ  = ('#92400E', '#F59E0B', '#FCD34D', '#FEF3C7')
+FORMAL_GRAY_SEQ   = ('#334155', '#475569', '#64748B', '#94A3B8', '#CBD5E1', '#E2E8F0', '#F1F5F9')
 BG_FORMAL_LIGHT   = "#F8FAFC"
 
 # Define calm pastel palette
-PASTEL_PALETTE = [
+PASTEL_PALETTE = (
     '#6366F1', # Indigo
     '#10B981', # Emerald
     '#F43F5E', # Rose
@@ -30,34 +33,49 @@ PASTEL_PALETTE = [
     '#F59E0B', # Amber
     '#EC4899', # Pink
     '#0EA5E9', # Sky
-]
+)
+
+# Layout pieces shared by every chart, built once at import. Plotly copies
+# them into each figure, so the same dicts are safe to reuse.
+_TITLE_FONT = dict(size=16, color="#1e293b", family="Inter, sans-serif")
+_BASE_LAYOUT = dict(
+    font=dict(family="Inter, sans-serif", color="#64748b"),
+    colorway=MODERN_BLUE_SEQ,
+    hoverlabel=dict(
+        bgcolor="white",
+        font_size=13,
+        font_family="Inter, sans-serif",
+        bordercolor="rgba(255, 255, 255, 0.05)"
+    ),
+    # No animated transitions: every Streamlit rerun redraws the chart
+    transition_duration=0
+)
+_LEGEND_H = dict(
+    orientation="h",
+    yanchor="bottom",
+    y=1.02,
+    xanchor="right",
+    x=1,
+    font=dict(size=10)
+)
+_LEGEND_V = dict(
+    orientation="v",
+    yanchor="middle",
+    y=0.5,
+    xanchor="left",
+    x=1.02,
+    font=dict(size=10)
+)
+_AXIS_TICKFONT = dict(size=10, color="#94a3b8")
+
 
 def update_chart_layout(fig, title="", show_legend=True, height=280, margin=dict(l=20, r=20, t=60, b=20), legend_orientation="h", bg_color="rgba(0,0,0,0)"):
     """Helper to apply consistent calm styling with compact sizing"""
-    
-    legend_config = dict(
-        orientation="h",
-        yanchor="bottom",
-        y=1.02,
-        xanchor="right",
-        x=1,
-        font=dict(size=10)
-    )
-    
-    if legend_orientation == "v":
-        legend_config = dict(
-            orientation="v",
-            yanchor="middle",
-            y=0.5,
-            xanchor="left",
-            x=1.02,
-            font=dict(size=10)
-        )
-
     fig.update_layout(
+        **_BASE_LAYOUT,
         title=dict(
             text=f"<b>{title}</b>" if title else "",
-            font=dict(size=16, color="#1e293b", family="Inter, sans-serif"),
+            font=_TITLE_FONT,
             x=0.05,
             xanchor='left',
             y=0.95,
@@ -65,24 +83,202 @@ def update_chart_layout(fig, title="", show_legend=True, height=280, margin=dict
         ),
         paper_bgcolor=bg_color,
         plot_bgcolor=bg_color,
-        font=dict(family="Inter, sans-serif", color="#64748b"),
         showlegend=show_legend,
         margin=margin,
-        colorway=MODERN_BLUE_SEQ,
         height=height,
-        hoverlabel=dict(
-            bgcolor="white",
-            font_size=13,
-            font_family="Inter, sans-serif",
-            bordercolor="rgba(255, 255, 255, 0.05)"
-        ),
-        legend=legend_config
+        legend=_LEGEND_V if legend_orientation == "v" else _LEGEND_H
     )
     # Modern grid and axes
-    fig.update_xaxes(showgrid=False, zeroline=False, tickfont=dict(size=10, color="#94a3b8"))
-    fig.update_yaxes(showgrid=True, gridcolor="rgba(255,255,255,0.3)" if bg_color != "rgba(0,0,0,0)" else "#f1f5f9", zeroline=False, tickfont=dict(size=10, color="#94a3b8"))
+    fig.update_xaxes(showgrid=False, zeroline=False, tickfont=_AXIS_TICKFONT)
+    fig.update_yaxes(showgrid=True, gridcolor="rgba(255,255,255,0.3)" if bg_color != "rgba(0,0,0,0)" else "#f1f5f9", zeroline=False, tickfont=_AXIS_TICKFONT)
     return fig
 
+
+# Cached aggregations: reruns (metric radio, widget clicks) on unchanged data
+# reuse these instead of re-scanning leads_df. Callers pass only the columns
+# each helper needs, so the argument hash stays cheap.
+_CHART_CACHE_ENTRIES = 8
+
+# Bounce type left out of the breakdown (placeholders are NaN after processing)
+_BOUNCE_EXCLUDE = ['unknown']
+
+# Pies with more slices than this are drawn without white slice borders
+_PIE_BORDER_MAX_SLICES = 10
+
+# Trend series longer than this are drawn with WebGL (Scattergl)
+_WEBGL_MIN_POINTS = 1000
+
+# Note: 'Objection' might be 'Objections' or 'Objection' depending on exact enum
+_INTERESTED_STATUSES = ('Interested', 'Objection', 'Objections')
+
+# Statuses charted per day in Performance Trends
+_TREND_STATUSES = ['Interested', 'Not Interested', 'Objection', 'Automated Reply', 'Revisit Later', 'Bounced']
+
+
+@st.cache_data(show_spinner=False, max_entries=_CHART_CACHE_ENTRIES)
+def _value_counts(values: pd.Series) -> pd.Series:
+    """Count occurrences of each value (lead ESP, sender ESP)."""
+    counts = values.value_counts()
+    # Categorical columns also report categories absent from this subset
+    return counts[counts > 0]
+
+
+@st.cache_data(show_spinner=False, max_entries=_CHART_CACHE_ENTRIES)
+def _status_artifacts(status: pd.Series) -> dict:
+    """
+    Scan the status column once for the reply breakdown and the leads table.
+    
+    Args:
+        status: Lead status column
+        
+    Returns:
+        Dict with 'counts' (value counts) and 'interested_idx' (index labels
+        of Interested / Objection leads)
+    """
+    counts = status.value_counts()
+    return {
+        'counts': counts[counts > 0],
+        'interested_idx': status.index[status.isin(_INTERESTED_STATUSES)],
+    }
+
+
+@st.cache_data(show_spinner=False, max_entries=_CHART_CACHE_ENTRIES)
+def _bounce_counts(bounce_type: pd.Series) -> pd.Series:
+    """Count bounce types, skipping missing and 'unknown' values."""
+    counts = bounce_type.value_counts(dropna=True)
+    counts = counts[counts > 0]
+    # Filter on the handful of distinct labels, not on every row
+    return counts[~counts.index.astype(str).str.lower().isin(_BOUNCE_EXCLUDE)]
+
+
+@st.cache_data(show_spinner=False, max_entries=_CHART_CACHE_ENTRIES)
+def _esp_pivots(esp_df: pd.DataFrame):
+    """
+    Count replies and human replies per sender ESP x lead ESP.
+    
+    Args:
+        esp_df: sender_inbox_esp, lead_esp, unique_replies and is_human_reply columns
+        
+    Returns:
+        Tuple of (reply counts, human reply counts) pivots with 'Total' margins
+    """
+    # int8 indicators as bare arrays: narrow inputs for the grouped sums, and
+    # no copy of esp_df to hang them on
+    is_reply = (pd.to_numeric(esp_df['unique_replies'], errors='coerce').fillna(0).to_numpy() > 0).astype(np.int8)
+    is_human = (pd.to_numeric(esp_df['is_human_reply'], errors='coerce').fillna(0).to_numpy() > 0).astype(np.int8)
+    sender, lead = esp_df['sender_inbox_esp'], esp_df['lead_esp']
+    
+    if isinstance(sender.dtype, pd.CategoricalDtype) and isinstance(lead.dtype, pd.CategoricalDtype):
+        # Bincount over category codes (numba kernel for very large frames)
+        p_total, p_human = esp_reply_crosstab(sender, lead, is_reply, is_human)
+    else:
+        indicators = pd.DataFrame(
+            {'is_reply_bool': is_reply, 'is_human_reply_bool': is_human}, index=esp_df.index
+        )
+        # One grouping pass for both tables instead of two pivot_table scans
+        sums = indicators.groupby([sender, lead], observed=True).sum()
+        p_total = sums['is_reply_bool'].unstack('lead_esp', fill_value=0)
+        p_human = sums['is_human_reply_bool'].unstack('lead_esp', fill_value=0)
+    return _with_totals(p_total), _with_totals(p_human)
+
+
+def _with_totals(table: pd.DataFrame) -> pd.DataFrame:
+    """
+    Add 'Total' margins to a sender ESP x lead ESP count table.
+    
+    Matches pivot_table(..., margins=True, margins_name='Total').
+    """
+    # Plain labels: a CategoricalIndex cannot take the new 'Total' label
+    table.index = table.index.astype(object)
+    table.columns = table.columns.astype(object)
+    table['Total'] = table.sum(axis=1)
+    totals = table.sum().to_frame('Total').T
+    return pd.concat([table, totals]).rename_axis(table.index.name)
+
+
+@st.cache_data(show_spinner=False, max_entries=_CHART_CACHE_ENTRIES)
+def _daily_activity(activity_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Count replies and each trend status per day.
+    
+    Args:
+        activity_df: Date, unique_replies and status columns
+        
+    Returns:
+        DataFrame with a Date column plus one count column per metric
+    """
+    dates = activity_df['Date']
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(dates, errors='coerce')
+    # Day buckets as datetime64 (int64 keys), not Python date objects
+    dates = dates.dt.floor('D')
+    
+    # One int8 indicator per metric, summed in a single groupby instead of a
+    # filter + groupby().size() per metric
+    status = activity_df['status']
+    indicators = {'Replies': (activity_df['unique_replies'].to_numpy() > 0).astype(np.int8)}
+    for trend_status in _TREND_STATUSES:
+        indicators[trend_status] = (status == trend_status).to_numpy().astype(np.int8)
+    
+    daily_df = pd.DataFrame(indicators, index=activity_df.index).groupby(dates, sort=True).sum()
+    return daily_df.rename_axis('Date').reset_index()
+
+
+@st.cache_data(show_spinner=False, max_entries=_CHART_CACHE_ENTRIES)
+def _campaign_name_map(campaign_names: pd.DataFrame) -> dict:
+    """
+    Map campaign_id to campaign Name.
+    
+    Args:
+        campaign_names: campaign_id and Name columns
+        
+    Returns:
+        Dict of int campaign_id to Name (first Name wins for duplicate IDs)
+    """
+    # Normalize types to match leads_df (int64 from the processor)
+    ids = pd.to_numeric(campaign_names['campaign_id'], errors='coerce')
+    mapping = pd.Series(campaign_names['Name'].to_numpy(), index=ids)
+    mapping = mapping[mapping.index.notna()]
+    mapping.index = mapping.index.astype(np.int64)
+    return mapping[~mapping.index.duplicated(keep='first')].to_dict()
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _csv_bytes(df: pd.DataFrame) -> bytes:
+    """Encode the performance table for the CSV download (once per table version)."""
+    return df.to_csv(index=False).encode('utf-8')
+
+
+def _leads_contacted_total(campaigns_df: pd.DataFrame, leads_df: pd.DataFrame):
+    """
+    Total leads contacted across the campaigns, or the lead count as fallback.
+    
+    process_campaigns already stores leads_contacted as a NaN-free numeric
+    column, so this is a plain column sum.
+    """
+    if not campaigns_df.empty and 'leads_contacted' in campaigns_df.columns:
+        return campaigns_df['leads_contacted'].sum()
+    return len(leads_df)
+
+
+def _status_style(col: pd.Series) -> np.ndarray:
+    """Return the CSS for a whole status column in one vectorized pass."""
+    values = col.to_numpy()
+    return np.select(
+        [values == 'Interested', np.isin(values, ('Objection', 'Objections'))],
+        [
+            'background-color: #d4edda; color: #155724',  # Green
+            'background-color: #fff3cd; color: #856404',  # Yellow
+        ],
+        default=''
+    )
+
+
+def _fmt_rate_count(rate: pd.Series, cnt: pd.Series, pct_scale: float = 100) -> pd.Series:
+    """Format rate/count columns as "33.00% (115)" without a per-row apply."""
+    return (rate * pct_scale).map('{:.2f}%'.format) + ' (' + cnt.fillna(0).astype(np.int64).astype(str) + ')'
+
+
 @st.dialog("⚠️ Confirm Deletion")
 def _email_confirm_delete_dialog(campaign_id, campaign_name: str, index: int):
     """Dialog to confirm email campaign deletion (mirrors LinkedIn pattern)."""
@@ -105,22 +301,20 @@ def _email_confirm_delete_dialog(campaign_id, campaign_name: str, index: int):
     with col1:
         if st.button("✅ Yes, Delete", key=f"email_confirm_del_{campaign_id}_{index}",
                      type="primary", width="stretch"):
-            from api.email_api import EmailCampaignAPI
-            api = EmailCampaignAPI()
+            from api.email_api import get_email_api
+            api = get_email_api()
             with st.spinner("Deleting campaign..."):
                 response = api.delete_campaign(str(campaign_id))
 
-            if isinstance(response, dict) and response.get('success', False):
-                st.session_state['email_delete_success'] = response.get(
-                    'message', f"Campaign '{campaign_name}' deleted successfully!"
+            if response.success:
+                from email_campaigns.components.dashboard import clear_email_data_cache
+                clear_email_data_cache()
+                st.session_state['email_delete_success'] = (
+                    response.message or f"Campaign '{campaign_name}' deleted successfully!"
                 )
                 st.rerun()
             else:
-                error_message = (
-                    response.get('message', 'Failed to delete campaign')
-                    if isinstance(response, dict) else str(response)
-                )
-                st.session_state['email_delete_error'] = error_message
+                st.session_state['email_delete_error'] = response.message or 'Failed to delete campaign'
                 st.rerun()
     with col2:
         if st.button("❌ Cancel", key=f"email_cancel_del_{campaign_id}_{index}",
@@ -128,6 +322,66 @@ def _email_confirm_delete_dialog(campaign_id, campaign_name: str, index: int):
             st.rerun()
 
 
+def _chart_bounce(leads_df: pd.DataFrame) -> None:
+    """Render the bounce type pie (or a note when there are no bounces)."""
+    # Clean up bounce data for cleaner pie chart
+    bounce_counts = _bounce_counts(leads_df['bounce_type'])
+    if bounce_counts.empty:
+        st.info("No detailed bounce analysis available")
+        return
+    
+    fig = px.pie(values=bounce_counts.to_numpy(dtype=np.float32), names=bounce_counts.index, hole=0.7,
+                 color_discrete_sequence=MODERN_PURPLE_SEQ)
+    update_chart_layout(fig, title='Bounce Type', show_legend=True, height=230, 
+                        margin=dict(l=20, r=80, t=60, b=10), legend_orientation="v", bg_color=BG_FORMAL_LIGHT)
+    # Slice borders are one SVG stroke each; skip them on crowded pies
+    border_width = 2 if len(bounce_counts) <= _PIE_BORDER_MAX_SLICES else 0
+    fig.update_traces(textposition='inside', textinfo='percent', marker=dict(line=dict(color='#ffffff', width=border_width)))
+    st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
+
+
+def _chart_top_campaigns(campaigns_df: pd.DataFrame) -> None:
+    """Render the five campaigns with the highest bounce rate."""
+    if 'bounce_rate' not in campaigns_df.columns:
+        campaigns_df = campaigns_df.assign(
+            bounce_rate=(campaigns_df['bounced'] / campaigns_df['emails_sent'] * 100).fillna(0)
+        )
+    
+    top_b = campaigns_df.sort_values('bounce_rate', ascending=False).head(5)
+    fig = px.bar(top_b, x='bounce_rate', y='Name', orientation='h', color='bounce_rate',
+                 color_continuous_scale=['#DBEAFE', '#93C5FD', '#3B82F6', '#1E40AF', '#1e3a8a'],
+                 labels={'bounce_rate': 'Bounce %'})
+    fig.update_coloraxes(colorbar=dict(tickfont=dict(color='#64748b'), title=dict(font=dict(color='#64748b'))))
+    update_chart_layout(fig, title='High Bounce Campaigns', show_legend=False, height=250, 
+                        margin=dict(l=20, r=10, t=60, b=10), bg_color=BG_FORMAL_LIGHT)
+    fig.update_traces(marker_cornerradius=10)
+    st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
+
+
+def _esp_pie(counts: pd.Series, title: str, palette) -> None:
+    """Render an ESP distribution pie; skipped when there is nothing to count."""
+    if counts.empty:
+        return
+    
+    fig = px.pie(values=counts.to_numpy(dtype=np.float32), names=counts.index, hole=0.7,
+                 color_discrete_sequence=palette)
+    update_chart_layout(fig, title=title, show_legend=True, height=220, 
+                        margin=dict(l=20, r=80, t=60, b=10), legend_orientation="v", bg_color=BG_FORMAL_LIGHT)
+    fig.update_layout(paper_bgcolor=BG_FORMAL_LIGHT, plot_bgcolor=BG_FORMAL_LIGHT)
+    fig.update_traces(textposition='inside', textinfo='percent')
+    st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
+
+
+def _chart_lead_esp(leads_df: pd.DataFrame) -> None:
+    """Render the lead ESP distribution pie."""
+    _esp_pie(_value_counts(leads_df['lead_esp']), 'Lead ESP Dist.', MODERN_AMBER_SEQ)
+
+
+def _chart_sender_esp(leads_df: pd.DataFrame) -> None:
+    """Render the sender ESP distribution pie."""
+    _esp_pie(_value_counts(leads_df['sender_inbox_esp']), 'Sender ESP Dist.', MODERN_PURPLE_SEQ)
+
+
 def render_charts(leads_df: pd.DataFrame, campaigns_df: pd.DataFrame, key_prefix: str = "default"):
     """
     Render dashboard charts in a compact, detailed grid layout matching the reference design.
@@ -136,20 +390,11 @@ def render_charts(leads_df: pd.DataFrame, campaigns_df: pd.DataFrame, key_prefix
         st.info("No data available to render charts.")
         return
 
-    # Helper: Custom standard Plotly margin for small square cards
-    SQUARE_MARGIN = dict(l=20, r=10, t=60, b=10)
+    # Plotly corner rounding lives in assets/styles.css
     
-    # Global Plotly Corner Rounding
-    st.markdown("""
-        <style>
-        iframe[title="plotly.graph_objs._figure.Figure"], 
-        .js-plotly-plot, 
-        div[data-testid="stPlotlyChart"] {
-            border-radius: 16px !important;
-            overflow: hidden !important;
-        }
-        </style>
-    """, unsafe_allow_html=True)
+    # Column checks done once; chart helpers below only run when they apply
+    has_sender = 'sender_inbox_esp' in leads_df.columns
+    has_lead = 'lead_esp' in leads_df.columns
 
     # Section 1: Dashboard Metrics & Breakdown
     st.markdown("<h3 style='margin-bottom: 20px;'>Dashboard Metrics</h3>", unsafe_allow_html=True)
@@ -159,13 +404,11 @@ def render_charts(leads_df: pd.DataFrame, campaigns_df: pd.DataFrame, key_prefix
     # Column 1: Overall Reply Metrics
     with r1_col1:
         # Calculate rates
-        if not campaigns_df.empty and 'leads_contacted' in campaigns_df.columns:
-            total_leads = pd.to_numeric(campaigns_df['leads_contacted'], errors='coerce').fillna(0).sum()
-        else:
-            total_leads = len(leads_df)
+        total_leads = _leads_contacted_total(campaigns_df, leads_df)
             
-        human_replies = leads_df['is_human_reply'].fillna(0).sum()
-        total_replies = leads_df[leads_df['unique_replies'] > 0].fillna(0).shape[0]
+        # Straight numpy reductions: no fillna copy or filtered frame
+        human_replies = float(np.nansum(leads_df['is_human_reply'].to_numpy(dtype=np.float64, na_value=0.0)))
+        total_replies = int((leads_df['unique_replies'].to_numpy() > 0).sum())
         
         human_rate = (human_replies / total_leads * 100) if total_leads > 0 else 0
         overall_rate = (total_replies / total_leads * 100) if total_leads > 0 else 0
@@ -196,15 +439,13 @@ def render_charts(leads_df: pd.DataFrame, campaigns_df: pd.DataFrame, key_prefix
 
     # Column 2: Reply Type Breakdown
     with r1_col2:
-        status_counts = leads_df['status'].value_counts()
+        status_counts = _status_artifacts(leads_df['status'])['counts']
         interested_stats = ['Interested', 'Not Interested', 'Objection', 'Automated Reply', 'Revisit Later', 'Bounced']
         data = pd.DataFrame({
             'Status': interested_stats,
-            'Count': [status_counts.get(s, 0) for s in interested_stats]
+            'Count': np.array([status_counts.get(s, 0) for s in interested_stats], dtype=np.float32)
         })
         
-        colors = [MODERN_GREEN_SEQ[0], MODERN_ROSE_SEQ[0], MODERN_AMBER_SEQ[0], MODERN_PURPLE_SEQ[0], MODERN_BLUE_SEQ[1], MODERN_ROSE_SEQ[1]]
-        
         REPLY_COLOR_MAP = {
             'Interested':      '#059669',  # strong green
             'Objection':       '#6EE7B7',  # medium soft green
@@ -214,6 +455,7 @@ def render_charts(leads_df: pd.DataFrame, campaigns_df: pd.DataFrame, key_prefix
             'Revisit Later':   '#D1FAE5',  # very light green
         }
 
+        # Numeric float arrays are sent to the browser as base64 typed arrays
         fig = px.bar(data, x='Count', y='Status', orientation='h', color='Status',
                      color_discrete_map=REPLY_COLOR_MAP)
         update_chart_layout(fig, title='Reply Breakdown', show_legend=False, height=230, 
@@ -221,25 +463,9 @@ def render_charts(leads_df: pd.DataFrame, campaigns_df: pd.DataFrame, key_prefix
         fig.update_traces(marker_cornerradius=8, width=0.6)
         st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
 
-    # Column 3: Bounce Type Distribution
     # Column 3: Bounce Type Distribution
     with r1_col3:
-        # Clean up bounce data for cleaner pie chart
-        valid_bounces = leads_df[leads_df['bounce_type'].notna()].copy()
-        # Filter commonly unhelpful categories
-        exclude = ['', 'unknown', 'None', 'nan', 'null']
-        valid_bounces = valid_bounces[~valid_bounces['bounce_type'].astype(str).str.lower().isin(exclude)]
-        
-        bounce_counts = valid_bounces['bounce_type'].value_counts()
-        if not bounce_counts.empty:
-            fig = px.pie(values=bounce_counts.values, names=bounce_counts.index, hole=0.7,
-                         color_discrete_sequence=MODERN_PURPLE_SEQ)
-            update_chart_layout(fig, title='Bounce Type', show_legend=True, height=230, 
-                                margin=dict(l=20, r=80, t=60, b=10), legend_orientation="v", bg_color=BG_FORMAL_LIGHT)
-            fig.update_traces(textposition='inside', textinfo='percent', marker=dict(line=dict(color='#ffffff', width=2)))
-            st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
-        else:
-            st.info("No detailed bounce analysis available")
+        _chart_bounce(leads_df)
     # Section 4: Campaign Performance
     # st.markdown("---")
     # st.markdown("<h3 style='margin-bottom: 20px;'>🔍 Campaign Performance</h3>", unsafe_allow_html=True)
@@ -248,37 +474,20 @@ def render_charts(leads_df: pd.DataFrame, campaigns_df: pd.DataFrame, key_prefix
         # st.markdown("<h3 style='margin-bottom: 20px;'>🔍 Campaign Performance</h3>", unsafe_allow_html=True)
         # High Bounce Campaigns Bar Chart (vertical/list style)
         if not campaigns_df.empty:
-            if 'bounce_rate' not in campaigns_df.columns:
-                campaigns_df['bounce_rate'] = (campaigns_df['bounced'] / campaigns_df['emails_sent'] * 100).fillna(0)
-            
-            top_b = campaigns_df.sort_values('bounce_rate', ascending=False).head(5)
-            fig = px.bar(top_b, x='bounce_rate', y='Name', orientation='h', color='bounce_rate',
-                         color_continuous_scale=['#DBEAFE', '#93C5FD', '#3B82F6', '#1E40AF', '#1e3a8a'],
-                         labels={'bounce_rate': 'Bounce %'})
-            fig.update_coloraxes(colorbar=dict(tickfont=dict(color='#64748b'), title=dict(font=dict(color='#64748b'))))
-            update_chart_layout(fig, title='High Bounce Campaigns', show_legend=False, height=250, 
-                                margin=dict(l=20, r=10, t=60, b=10), bg_color=BG_FORMAL_LIGHT)
-            fig.update_traces(marker_cornerradius=10)
-            st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
+            _chart_top_campaigns(campaigns_df)
 
         # --- ROW 3: ESP Performance Matrix ---
-    if 'sender_inbox_esp' in leads_df.columns and 'lead_esp' in leads_df.columns:
+    if has_sender and has_lead:
         # st.markdown("---")
         st.markdown("<h3 style='margin-bottom: 20px;'>🌐 ESP Performance Matrix</h3>", unsafe_allow_html=True)
         
-        df_pivot = leads_df.copy()
-        # Logic requested by user
-        df_pivot['is_reply_bool'] = pd.to_numeric(df_pivot['unique_replies'], errors='coerce').fillna(0) > 0
-        df_pivot['is_human_reply_bool'] = pd.to_numeric(df_pivot['is_human_reply'], errors='coerce').fillna(0) > 0
-        
         # Calculate leads contacted based on unique sender_inbox_esp count
-        if df_pivot['sender_inbox_esp'].nunique() == 1:
-            if not campaigns_df.empty and 'leads_contacted' in campaigns_df.columns:
-                 total_leads_contacted = pd.to_numeric(campaigns_df['leads_contacted'], errors='coerce').fillna(0).sum()
-            else:
-                 total_leads_contacted = len(df_pivot)
+        if leads_df['sender_inbox_esp'].nunique() == 1:
+            total_leads_contacted = _leads_contacted_total(campaigns_df, leads_df)
         else:
-            total_leads_contacted = df_pivot.groupby('sender_inbox_esp')['lead_id'].count()
+            # Row counts per sender ESP: size() never reads lead_id values
+            total_leads_contacted = leads_df.groupby('sender_inbox_esp', observed=True, sort=False).size()
+            total_leads_contacted.index = total_leads_contacted.index.astype(object)
             total_leads_contacted['Total'] = total_leads_contacted.sum()
 
         has_data = (total_leads_contacted.sum() > 0) if isinstance(total_leads_contacted, pd.Series) else (total_leads_contacted > 0)
@@ -289,8 +498,9 @@ def render_charts(leads_df: pd.DataFrame, campaigns_df: pd.DataFrame, key_prefix
             with esp_col_left:
                 # 1. Total Reply Rate Matrix
                 st.markdown("<p style='font-size: 0.9rem; font-weight: 700; color: #1e293b; margin-top: 10px;'>Total Reply Rate (%)</p>", unsafe_allow_html=True)
-                p_total = pd.pivot_table(df_pivot, values='is_reply_bool', index='sender_inbox_esp', 
-                                         columns='lead_esp', aggfunc='sum', margins=True, margins_name='Total').fillna(0)
+                p_total, p_human = _esp_pivots(
+                    leads_df[['sender_inbox_esp', 'lead_esp', 'unique_replies', 'is_human_reply']]
+                )
                 
                 if isinstance(total_leads_contacted, (int, float, np.number)):
                     p_total = (p_total / total_leads_contacted) * 100
@@ -303,8 +513,6 @@ def render_charts(leads_df: pd.DataFrame, campaigns_df: pd.DataFrame, key_prefix
                 
                 # 2. Human Reply Rate Matrix
                 st.markdown("<p style='font-size: 0.9rem; font-weight: 700; color: #1e293b;'>Human Reply Rate (%)</p>", unsafe_allow_html=True)
-                p_human = pd.pivot_table(df_pivot, values='is_human_reply_bool', index='sender_inbox_esp', 
-                                         columns='lead_esp', aggfunc='sum', margins=True, margins_name='Total').fillna(0)
                 
                 if isinstance(total_leads_contacted, (int, float, np.number)):
                     p_human = (p_human / total_leads_contacted) * 100
@@ -315,28 +523,9 @@ def render_charts(leads_df: pd.DataFrame, campaigns_df: pd.DataFrame, key_prefix
 
             with esp_col_right:
                 # 1. Lead ESP Distribution Pie
-                if 'lead_esp' in df_pivot.columns:
-                    l_counts = df_pivot['lead_esp'].value_counts()
-                    if not l_counts.empty:
-                        fig_l = px.pie(values=l_counts.values, names=l_counts.index, hole=0.7,
-                                     color_discrete_sequence=MODERN_AMBER_SEQ)
-                        update_chart_layout(fig_l, title='Lead ESP Dist.', show_legend=True, height=220, 
-                                            margin=dict(l=20, r=80, t=60, b=10), legend_orientation="v", bg_color=BG_FORMAL_LIGHT)
-                        fig_l.update_layout(paper_bgcolor=BG_FORMAL_LIGHT, plot_bgcolor=BG_FORMAL_LIGHT)
-                        fig_l.update_traces(textposition='inside', textinfo='percent')
-                        st.plotly_chart(fig_l, use_container_width=True, config={'displayModeBar': False})
-                
+                _chart_lead_esp(leads_df)
                 # 2. Sender ESP Distribution Pie
-                if 'sender_inbox_esp' in df_pivot.columns:
-                    s_counts = df_pivot['sender_inbox_esp'].value_counts()
-                    if not s_counts.empty:
-                        fig_s = px.pie(values=s_counts.values, names=s_counts.index, hole=0.7,
-                                     color_discrete_sequence=MODERN_PURPLE_SEQ)
-                        update_chart_layout(fig_s, title='Sender ESP Dist.', show_legend=True, height=220, 
-                                            margin=dict(l=20, r=80, t=60, b=10), legend_orientation="v", bg_color=BG_FORMAL_LIGHT)
-                        fig_s.update_layout(paper_bgcolor=BG_FORMAL_LIGHT, plot_bgcolor=BG_FORMAL_LIGHT)
-                        fig_s.update_traces(textposition='inside', textinfo='percent')
-                        st.plotly_chart(fig_s, use_container_width=True, config={'displayModeBar': False})
+                _chart_sender_esp(leads_df)
         else:
             st.info("Insufficient data for ESP Matrix calculations.")
 
@@ -344,23 +533,7 @@ def render_charts(leads_df: pd.DataFrame, campaigns_df: pd.DataFrame, key_prefix
     if 'Date' in leads_df.columns:
         # Performance Trends (title handled inside fig.update_layout)
         
-        df_ts = leads_df.copy()
-        df_ts['Date'] = pd.to_datetime(df_ts['Date'], errors='coerce').dt.date
-        df_ts = df_ts[df_ts['Date'].notna()]
-        
-        all_dates = sorted(df_ts['Date'].unique())
-        daily_df = pd.DataFrame({'Date': all_dates}).set_index('Date')
-        
-        # Map all requested metrics
-        daily_df['Replies'] = df_ts[df_ts['unique_replies'] > 0].groupby('Date').size()
-        daily_df['Interested'] = df_ts[df_ts['status'] == 'Interested'].groupby('Date').size()
-        daily_df['Not Interested'] = df_ts[df_ts['status'] == 'Not Interested'].groupby('Date').size()
-        daily_df['Objection'] = df_ts[df_ts['status'] == 'Objection'].groupby('Date').size()
-        daily_df['Automated Reply'] = df_ts[df_ts['status'] == 'Automated Reply'].groupby('Date').size()
-        daily_df['Revisit Later'] = df_ts[df_ts['status'] == 'Revisit Later'].groupby('Date').size()
-        daily_df['Bounced'] = df_ts[df_ts['status'] == 'Bounced'].groupby('Date').size()
-        
-        daily_df = daily_df.fillna(0).reset_index()
+        daily_df = _daily_activity(leads_df[['Date', 'unique_replies', 'status']])
 
         METRIC_CONF = {
             'Replies':         ('#6366F1', 'rgba(99,102,241,0.1)'),
@@ -384,10 +557,15 @@ def render_charts(leads_df: pd.DataFrame, campaigns_df: pd.DataFrame, key_prefix
         with col_val:
             st.markdown(f"<div style='text-align: right;'><span style='color: #64748b; font-size: 0.8rem;'>Total {sel_met}:</span> <span style='font-size: 1.4rem; font-weight: 800; color: {line_col};'>+{total_v}</span></div>", unsafe_allow_html=True)
 
+        # WebGL for long ranges; it has no spline smoothing, so short ranges
+        # keep the SVG trace
+        use_gl = len(daily_df) > _WEBGL_MIN_POINTS
+        trace_cls = go.Scattergl if use_gl else go.Scatter
+        
         fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=daily_df['Date'], y=daily_df[sel_met],
-            mode='lines', line=dict(color=line_col, width=3, shape='spline'),
+        fig.add_trace(trace_cls(
+            x=daily_df['Date'].to_numpy(), y=daily_df[sel_met].to_numpy(dtype=np.float32),
+            mode='lines', line=dict(color=line_col, width=3, shape='linear' if use_gl else 'spline'),
             fill='tozeroy', fillcolor=fill_col,
             hovertemplate='%{x|%b %d}: <b>%{y}</b><extra></extra>'
         ))
@@ -434,27 +612,28 @@ def render_charts(leads_df: pd.DataFrame, campaigns_df: pd.DataFrame, key_prefix
             'not_interested': 'Not Interested',
             'automated_replies': 'Automated Replies'
         }
-        table_df = campaigns_df[list(display_cols.keys())].copy()
-        table_df = table_df.rename(columns=display_cols)
-
         # Format rate columns
-        table_df['Reply Rate (%)'] = table_df.apply(
-            lambda x: f"{x['Reply Rate (%)']*100:.2f}% ({int(x['Unique Replies'])})", axis=1)
-        table_df['Bounce Rate (%)'] = table_df.apply(
-            lambda x: f"{x['Bounce Rate (%)']*100:.2f}% ({int(x['Bounces'])})", axis=1)
-        table_df['Interested Rate (%)'] = table_df.apply(
-            lambda x: f"{x['Interested Rate (%)']:.2f}% ({int(x['Interested'])})", axis=1)
-        table_df['Not Interested Rate (%)'] = table_df.apply(
-            lambda x: f"{x['Not Interested Rate (%)']*100:.2f}% ({int(x['Not Interested'])})", axis=1)
-        table_df['Automated Rate (%)'] = table_df.apply(
-            lambda x: f"{x['Automated Rate (%)']*100:.2f}% ({int(x['Automated Replies'])})", axis=1)
-        table_df['Human Reply Rate (%)'] = table_df.apply(
-            lambda x: f"{x['Human Reply Rate (%)']*100:.2f}% ({int(x['Human Replies'])})", axis=1)
-
-        csv = table_df.to_csv(index=False).encode('utf-8')
+        formatted = {
+            'total_reply_rate': _fmt_rate_count(campaigns_df['total_reply_rate'], campaigns_df['total_replies']),
+            'bounce_rate': _fmt_rate_count(campaigns_df['bounce_rate'], campaigns_df['bounced']),
+            # Interested rate is already a percentage
+            'semantic_interested_reply_rate': _fmt_rate_count(
+                campaigns_df['semantic_interested_reply_rate'], campaigns_df['interested_sementic'], pct_scale=1),
+            'not_interested_reply_rate': _fmt_rate_count(
+                campaigns_df['not_interested_reply_rate'], campaigns_df['not_interested']),
+            'automated_reply_rate': _fmt_rate_count(
+                campaigns_df['automated_reply_rate'], campaigns_df['automated_replies']),
+            'human_reply_rate': _fmt_rate_count(campaigns_df['human_reply_rate'], campaigns_df['human_reply']),
+        }
+        # Build the renamed table in one construction (no select-copy, rename
+        # and per-column overwrites)
+        table_df = pd.DataFrame({
+            label: formatted.get(col, campaigns_df[col]) for col, label in display_cols.items()
+        })
+
         st.download_button(
             label="📥 Download CSV",
-            data=csv,
+            data=_csv_bytes(table_df),
             file_name=f"campaign_performance_{datetime.datetime.now().strftime('%Y%m%d')}.csv",
             mime='text/csv',
             key=f"{key_prefix}_download_csv"
@@ -536,30 +715,15 @@ def render_interested_leads_table(leads_df: pd.DataFrame, campaigns_df: pd.DataF
     st.subheader("Interested & Objection Leads")
     
     if not leads_df.empty and 'status' in leads_df.columns:
-        # Filter for Interested or Objection
-        # Note: 'Objection' might be 'Objections' or 'Objection' depending on exact enum
-        target_statuses = ['Interested', 'Objection', 'Objections']
-        interested_df = leads_df[leads_df['status'].isin(target_statuses)].copy()
+        # Filter for Interested or Objection (mask shared with render_charts)
+        interested_idx = _status_artifacts(leads_df['status'])['interested_idx']
+        interested_df = leads_df.loc[interested_idx].copy()
         
         if not interested_df.empty:
             # Map campaign_id to Campaign Name
             if not campaigns_df.empty and 'campaign_id' in campaigns_df.columns and 'Name' in campaigns_df.columns:
-                # Create separate dataframe for mapping to avoid index issues
-                campaign_map = campaigns_df[['campaign_id', 'Name']].drop_duplicates('campaign_id').copy()
-                
-                # Normalize types to match leads_df (which is numeric)
-                # Convert campaign_map['campaign_id'] to numeric, coercing errors
-                campaign_map['campaign_id'] = pd.to_numeric(campaign_map['campaign_id'], errors='coerce')
-                
-                # Create mapping dictionary
-                # Drop NaNs to avoid mapping issues
-                campaign_map = campaign_map.dropna(subset=['campaign_id'])
-                campaign_dict = dict(zip(campaign_map['campaign_id'], campaign_map['Name']))
-                
-                # Ensure leads_df ID is also treated as numeric (it should be, but just in case)
-                interested_df['campaign_id'] = pd.to_numeric(interested_df['campaign_id'], errors='coerce')
-                
-                # Apply map
+                # Cached per campaigns version; leads campaign_id is already int64
+                campaign_dict = _campaign_name_map(campaigns_df[['campaign_id', 'Name']])
                 interested_df['Campaign Name'] = interested_df['campaign_id'].map(campaign_dict).fillna('Unknown')
             else:
                  interested_df['Campaign Name'] = 'Unknown'
@@ -597,16 +761,8 @@ def render_interested_leads_table(leads_df: pd.DataFrame, campaigns_df: pd.DataF
             display_df = interested_df[cols_to_show]
             
             # Formatting for display
-            def highlight_status(val):
-                color = ''
-                if val == 'Interested':
-                    color = 'background-color: #d4edda; color: #155724' # Green
-                elif val in ['Objection', 'Objections']:
-                    color = 'background-color: #fff3cd; color: #856404' # Yellow
-                return color
-
             st.dataframe(
-                display_df.style.map(highlight_status, subset=['status']),
+                display_df.style.apply(_status_style, subset=['status'], axis=0),
                 hide_index=True,
                 width='stretch'
             )
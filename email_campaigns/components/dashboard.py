@@ -5,40 +5,174 @@ This module contains the main email dashboard rendering logic,
 extracted from the original app.py for better organization.
 """
 
+import time
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
 import streamlit as st
 import pandas as pd
 
-from email_campaigns.data.repository import EmailRepository
+from email_campaigns.data.repository import EmailRepository, get_email_repository
 from email_campaigns.data.processor import DataProcessor
 from email_campaigns.components.filters import render_workspace_filters, render_campaign_filters
 from email_campaigns.components.kpi_cards import render_kpi_cards
 from email_campaigns.components.charts import render_charts, render_interested_leads_table
-from email_campaigns.components.sequence_stats import render_sequence_stats
-from email_campaigns.services.metrics import calculate_kpis, calculate_campaign_kpis, calculate_filtered_kpis, calculate_filtered_workspace_kpis
+from email_campaigns.services.metrics import calculate_all_campaign_kpis, calculate_filtered_kpis, calculate_filtered_workspace_kpis
+from shared.concurrency import run_concurrently
+from shared.ui_components import load_css
 from shared.date_utils import filter_dataframe_by_date
+import config
+
+
+# The base loaders persist their pickled DataFrames under
+# ~/.streamlit/cache. The pickles include lead PII (names, emails, replies),
+# so that directory must be treated like the database itself. Expect roughly
+# the in-memory size of the leads, campaigns and sequences frames for each of
+# the max_entries buckets kept. `streamlit cache clear` and the Refresh Data
+# button evict them.
+#
+# persist="disk" ignores ttl, so expiry is expressed through the epoch
+# argument instead: it changes every CACHE_TTL seconds, which moves the
+# loaders onto a fresh cache key. A restarted container therefore only skips
+# the database if it comes back within the same CACHE_TTL bucket; after a
+# longer restart the persisted entries are never hit again.
+_PERSISTED_ENTRIES = 2
+
+
+def _cache_epoch() -> int:
+    """Current CACHE_TTL-sized time bucket, used as a cache key."""
+    return int(time.time() // config.CACHE_TTL)
+
+
+@st.cache_data(persist="disk", max_entries=_PERSISTED_ENTRIES, show_spinner=False)
+def _load_leads(epoch: int) -> Tuple[pd.DataFrame, Dict[int, np.ndarray]]:
+    """
+    Fetch and process email leads.
+    
+    Args:
+        epoch: Cache bucket from _cache_epoch
+    
+    Returns:
+        Tuple of (leads_df, leads_by_campaign) where leads_by_campaign maps
+        each campaign_id to the row positions of its leads
+    """
+    leads_df = DataProcessor.process_leads(get_email_repository().get_leads())
+    if leads_df.empty or 'campaign_id' not in leads_df.columns:
+        return leads_df, {}
+    return leads_df, leads_df.groupby('campaign_id', sort=False).indices
+
+
+@st.cache_data(persist="disk", max_entries=_PERSISTED_ENTRIES, show_spinner=False)
+def _load_campaigns(epoch: int) -> Tuple[pd.DataFrame, Dict[str, np.ndarray]]:
+    """
+    Fetch email campaigns and enrich them with lead aggregates.
+    
+    Args:
+        epoch: Cache bucket from _cache_epoch
+    
+    Returns:
+        Tuple of (campaigns_df, campaigns_by_name) where campaigns_by_name
+        maps each campaign Name to its row positions
+    """
+    campaigns_raw = get_email_repository().get_campaigns()
+    leads_df, _ = _load_leads(epoch)
+    campaigns_df = DataProcessor.process_campaigns(campaigns_raw, leads_df)
+    if campaigns_df.empty:
+        return campaigns_df, {}
+    return campaigns_df, campaigns_df.groupby('Name', sort=False).indices
+
+
+@st.cache_data(persist="disk", max_entries=_PERSISTED_ENTRIES, show_spinner=False)
+def _load_sequences(epoch: int) -> pd.DataFrame:
+    """Fetch and process email sequences."""
+    return DataProcessor.process_email_sequences(get_email_repository().get_sequences())
+
+
+@st.cache_data(max_entries=_PERSISTED_ENTRIES, show_spinner=False)
+def _load_campaign_kpis(epoch: int) -> pd.DataFrame:
+    """Unfiltered KPIs of every campaign, indexed by campaign_id."""
+    campaigns_df, _ = _load_campaigns(epoch)
+    return calculate_all_campaign_kpis(campaigns_df)
+
+
+@st.cache_data(max_entries=_PERSISTED_ENTRIES, show_spinner=False)
+def _load_filter_options(epoch: int) -> Tuple[List[str], Dict[str, List[str]]]:
+    """
+    Sidebar dropdown options derived from the processed campaigns.
+    
+    Returns:
+        Tuple of (workspaces, campaigns_by_workspace) where workspaces starts
+        with "All Workspaces" and campaigns_by_workspace maps each workspace
+        option to its sorted campaign names
+    """
+    campaigns_df, _ = _load_campaigns(epoch)
+    workspaces = ["All Workspaces"]
+    campaigns_by_workspace = {"All Workspaces": []}
+    if campaigns_df.empty:
+        return workspaces, campaigns_by_workspace
+    
+    campaigns_by_workspace["All Workspaces"] = sorted(campaigns_df['Name'].dropna().unique().tolist())
+    if 'workspace_name' in campaigns_df.columns:
+        for workspace, names in campaigns_df.groupby('workspace_name', observed=True)['Name']:
+            campaigns_by_workspace[workspace] = sorted(names.dropna().unique().tolist())
+        workspaces.extend(sorted(campaigns_df['workspace_name'].dropna().unique().tolist()))
+    return workspaces, campaigns_by_workspace
+
+
+def clear_email_data_cache() -> None:
+    """Drop cached email data so the next run reloads it from the database."""
+    EmailRepository.get_campaigns.clear()
+    EmailRepository.get_leads.clear()
+    EmailRepository.get_sequences.clear()
+    for loader in (_load_leads, _load_campaigns, _load_sequences, _load_campaign_kpis, _load_filter_options):
+        loader.clear()
+
+
+def select_campaign_leads(
+    leads_df: pd.DataFrame,
+    leads_by_campaign: Dict[int, np.ndarray],
+    campaign_ids: Iterable[int]
+) -> pd.DataFrame:
+    """
+    Select the leads of the given campaigns using the precomputed index.
+    
+    Args:
+        leads_df: Leads the index was built from
+        leads_by_campaign: Mapping of campaign_id to row positions
+        campaign_ids: Campaigns to keep
+        
+    Returns:
+        Leads belonging to the campaigns, in their original order
+    """
+    positions = [leads_by_campaign[cid] for cid in campaign_ids if cid in leads_by_campaign]
+    if not positions:
+        return leads_df.iloc[:0]
+    return leads_df.iloc[np.sort(np.concatenate(positions))]
 
 
 def load_email_data():
     """
     Load and process email data from database.
     
+    Processed DataFrames are cached, so reruns within the cache TTL skip
+    both the database round trips and the processing. On a cold cache the
+    three tables are fetched concurrently.
+    
     Returns:
-        Tuple of (campaigns_df, leads_df, sequences_df)
+        Tuple of (campaigns_df, leads_df, sequences_df, leads_by_campaign,
+        campaigns_by_name, epoch). epoch is the cache bucket the frames were
+        loaded for; pass it to the other epoch-keyed loaders so a run that
+        crosses a CACHE_TTL boundary does not mix two data versions.
     """
-    repo = EmailRepository()
-    
+    epoch = _cache_epoch()
     with st.spinner("Loading dashboard data..."):
-        # Fetch data
-        leads_raw = repo.get_leads()
-        campaigns_raw = repo.get_campaigns()
-        sequences_raw = repo.get_sequences()
-        
-        # Process data
-        leads_df = DataProcessor.process_leads(leads_raw)
-        campaigns_df = DataProcessor.process_campaigns(campaigns_raw, leads_df)
-        sequences_df = DataProcessor.process_email_sequences(sequences_raw)
+        (leads_df, leads_by_campaign), (campaigns_df, campaigns_by_name), sequences_df = run_concurrently(
+            lambda: _load_leads(epoch),
+            lambda: _load_campaigns(epoch),
+            lambda: _load_sequences(epoch)
+        )
     
-    return campaigns_df, leads_df, sequences_df
+    return campaigns_df, leads_df, sequences_df, leads_by_campaign, campaigns_by_name, epoch
 
 
 def run_email_dashboard():
@@ -48,7 +182,8 @@ def run_email_dashboard():
     st.title("📧 Email Campaign KPI Dashboard")
     
     # Load data once
-    campaigns_df, leads_df, sequences_df = load_email_data()
+    campaigns_df, leads_df, sequences_df, leads_by_campaign, campaigns_by_name, epoch = load_email_data()
+    workspaces, campaigns_by_workspace = _load_filter_options(epoch)
     
     # Navigation State Management
     TABS = ["🏠 Workspace Overview", "🔍 Campaign Analysis"]
@@ -59,43 +194,8 @@ def run_email_dashboard():
         """Callback to switch to analysis tab."""
         st.session_state.active_tab = TABS[1]
     
-    # Custom CSS for radio button tabs
-    st.markdown("""
-    <style>
-        div[data-testid="stRadio"] > div {
-            flex-direction: row;
-            gap: 10px;
-        }
-        div[data-testid="stRadio"] label > div:first-child {
-            display: None;
-        }
-        div[data-testid="stRadio"] label {
-            background-color: white;
-            padding: 10px 20px;
-            border-radius: 8px;
-            border: 1px solid #e2e8f0;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            font-weight: 600;
-            color: #64748b;
-            box-shadow: 0 1px 2px rgba(0,0,0,0.05);
-        }
-        div[data-testid="stRadio"] label:hover {
-            border-color: #cbd5e1;
-            transform: translateY(-1px);
-        }
-        div[data-testid="stRadio"] label:has(input:checked) {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            border: none;
-            box-shadow: 0 4px 12px rgba(102, 126, 234, 0.4);
-        }
-        div[data-testid="stRadio"] label:has(input:checked) p {
-            color: white !important;
-            opacity: 1;
-        }
-    </style>
-    """, unsafe_allow_html=True)
+    # Radio buttons styled as tabs
+    load_css("assets/email_dashboard.css")
     
     # Tab Navigation
     # Using st.radio to control the view
@@ -120,10 +220,17 @@ def run_email_dashboard():
         # Workspace Overview Tab
         
         # 1. Render Filters (Workspace + Date)
-        selected_workspace, start_date, end_date = render_workspace_filters(campaigns_df)
+        selected_workspace, start_date, end_date = render_workspace_filters(campaigns_df, workspaces=workspaces)
         
-        # 2. Render Content
-        render_workspace_overview(campaigns_df, leads_df, selected_workspace, start_date, end_date)
+        # 2. Filter campaigns by workspace once, then render content
+        workspace_campaigns_df = campaigns_df
+        if selected_workspace != "All Workspaces" and not campaigns_df.empty:
+            workspace_campaigns_df = campaigns_df[campaigns_df['workspace_name'] == selected_workspace]
+        
+        render_workspace_overview(
+            workspace_campaigns_df, leads_df, leads_by_campaign,
+            start_date, end_date
+        )
         
     elif active_tab == TABS[1]:
         # Campaign Analysis Tab
@@ -131,11 +238,6 @@ def run_email_dashboard():
         # 1. Render Workspace Selector (Essential for filtering campaigns)
         # We manually render this part since render_campaign_filters expects a workspace input
         with st.sidebar: 
-            workspaces = ["All Workspaces"]
-            if not campaigns_df.empty and 'workspace_name' in campaigns_df.columns:
-                unique_ws = sorted(campaigns_df['workspace_name'].dropna().unique().tolist())
-                workspaces.extend(unique_ws)
-            
             selected_workspace = st.selectbox(
                 "Select Workspace",
                 options=workspaces,
@@ -145,37 +247,59 @@ def run_email_dashboard():
             st.caption(f"Viewing: {selected_workspace}")
             st.divider()
 
+        # Nothing to analyse: skip the campaign/date widgets entirely
+        available_campaigns = campaigns_by_workspace.get(selected_workspace, [])
+        if not available_campaigns:
+            st.warning("No campaigns available for this workspace.")
+            return
+
         # 2. Render Campaign & Date Filters
         # Note: render_campaign_filters might also render a "Filters" header.
         selected_campaign, start_date, end_date = render_campaign_filters(
             campaigns_df,
             workspace=selected_workspace,
-            on_change=switch_to_analysis
+            on_change=switch_to_analysis,
+            available_campaigns=available_campaigns
         )
         
         # 3. Render Content
         render_campaign_analysis(
-            campaigns_df, leads_df, sequences_df,
-            selected_campaign, start_date, end_date
+            campaigns_df, leads_df, sequences_df, leads_by_campaign, campaigns_by_name,
+            selected_campaign, start_date, end_date, epoch
         )
 
 
 
-def render_workspace_overview(campaigns_df: pd.DataFrame, leads_df: pd.DataFrame, selected_workspace: str, start_date=None, end_date=None):
-    """Render the workspace overview tab."""
+@st.fragment
+def render_workspace_overview(
+    filtered_campaigns_df: pd.DataFrame,
+    leads_df: pd.DataFrame,
+    leads_by_campaign: Dict[int, np.ndarray],
+    start_date=None,
+    end_date=None
+):
+    """
+    Render the workspace overview tab.
     
-    # Filter data by workspace
-    filtered_campaigns_df = campaigns_df.copy()
-    filtered_leads_df = leads_df.copy()
+    Runs as a fragment: widgets inside the tab body (e.g. the daily metric
+    selector) rerun only this tab, not the sidebar filters and data load.
     
-    if not campaigns_df.empty:
-        if selected_workspace != "All Workspaces":
-            filtered_campaigns_df = campaigns_df[campaigns_df['workspace_name'] == selected_workspace]
-        
-        if not filtered_campaigns_df.empty and 'campaign_id' in filtered_campaigns_df.columns:
-            valid_campaign_ids = set(filtered_campaigns_df['campaign_id'].dropna().unique())
-            if 'campaign_id' in filtered_leads_df.columns and not filtered_leads_df.empty:
-                filtered_leads_df = filtered_leads_df[filtered_leads_df['campaign_id'].isin(valid_campaign_ids)]
+    Args:
+        filtered_campaigns_df: Campaigns of the selected workspace
+        leads_df: All leads
+        leads_by_campaign: Mapping of campaign_id to lead row positions
+        start_date: Start of the activity date range
+        end_date: End of the activity date range
+    """
+    
+    # Narrow leads to the workspace's campaigns
+    filtered_leads_df = leads_df
+    
+    if not filtered_campaigns_df.empty and 'campaign_id' in filtered_campaigns_df.columns:
+        # campaign_id is int64 after processing, so there is nothing to drop
+        valid_campaign_ids = filtered_campaigns_df['campaign_id'].unique()
+        if 'campaign_id' in filtered_leads_df.columns and not filtered_leads_df.empty:
+            filtered_leads_df = select_campaign_leads(leads_df, leads_by_campaign, valid_campaign_ids)
     
     # Filter leads by date for activity metrics
     if not filtered_leads_df.empty and 'Date' in filtered_leads_df.columns and start_date and end_date:
@@ -191,22 +315,33 @@ def render_workspace_overview(campaigns_df: pd.DataFrame, leads_df: pd.DataFrame
     render_charts(filtered_leads_df, filtered_campaigns_df, key_prefix="workspace")
 
 
+@st.fragment
 def render_campaign_analysis(
     campaigns_df: pd.DataFrame,
     leads_df: pd.DataFrame,
     sequences_df: pd.DataFrame,
+    leads_by_campaign: Dict[int, np.ndarray],
+    campaigns_by_name: Dict[str, np.ndarray],
     selected_campaign: str,
     start_date,
-    end_date
+    end_date,
+    epoch: int
 ):
-    """Render the campaign analysis tab."""
+    """
+    Render the campaign analysis tab.
+    
+    Runs as a fragment, like render_workspace_overview. epoch is the cache
+    bucket the frames were loaded for (see load_email_data), so a fragment
+    rerun reads the KPIs of the same data version.
+    """
     
     if selected_campaign == "No campaigns available" or not selected_campaign:
         st.warning("No campaigns available regarding the filters.")
         return
     
     # Filter campaigns
-    campaign_data = campaigns_df[campaigns_df['Name'] == selected_campaign]
+    positions = campaigns_by_name.get(selected_campaign)
+    campaign_data = campaigns_df.iloc[positions] if positions is not None else campaigns_df.iloc[:0]
     
     if campaign_data.empty:
         st.warning(f"Campaign '{selected_campaign}' not found.")
@@ -215,35 +350,35 @@ def render_campaign_analysis(
     campaign_row = campaign_data.iloc[0]
     
     # Filter leads
-    filtered_leads_df = leads_df.copy()
+    filtered_leads_df = leads_df
     if not filtered_leads_df.empty and 'campaign_id' in campaign_data.columns:
         campaign_id = int(campaign_row['campaign_id'])
         if 'campaign_id' in filtered_leads_df.columns:
-            filtered_leads_df = filtered_leads_df[filtered_leads_df['campaign_id'] == campaign_id]
+            filtered_leads_df = select_campaign_leads(leads_df, leads_by_campaign, (campaign_id,))
         if 'Date' in filtered_leads_df.columns:
             filtered_leads_df = filter_dataframe_by_date(filtered_leads_df, 'Date', start_date, end_date)
     
     # Metrics
-    current_metrics = calculate_filtered_kpis(campaign_row, filtered_leads_df)
+    all_campaign_kpis = _load_campaign_kpis(epoch)
+    campaign_kpis = None
+    if campaign_row['campaign_id'] in all_campaign_kpis.index:
+        campaign_kpis = all_campaign_kpis.loc[campaign_row['campaign_id']].to_dict()
+    current_metrics = calculate_filtered_kpis(campaign_row, filtered_leads_df, campaign_kpis)
     
     st.subheader(f"Campaign: {selected_campaign}")
     render_kpi_cards(current_metrics)
     
-    campaign_df_single = pd.DataFrame([campaign_row])
+    campaign_df_single = campaign_data.iloc[[0]]
     render_charts(filtered_leads_df, campaign_df_single, key_prefix="campaign")
     
     render_interested_leads_table(filtered_leads_df, campaigns_df)
     
-    # Sequence Stats
+    # Sequence Stats (only needed on this tab, so imported here)
+    from email_campaigns.components.sequence_stats import render_sequence_stats
+    
     st.divider()
     campaign_sequences = pd.DataFrame()
     if not sequences_df.empty and 'campaign_id' in sequences_df.columns:
-        cid = campaign_row.get('campaign_id')
-        if cid is not None:
-            try:
-                cid_num = float(cid)
-                campaign_sequences = sequences_df[sequences_df['campaign_id'] == cid_num]
-            except:
-                campaign_sequences = sequences_df[sequences_df['campaign_id'].astype(str) == str(cid)]
+        campaign_sequences = sequences_df[sequences_df['campaign_id'] == int(campaign_row['campaign_id'])]
     
     render_sequence_stats(filtered_leads_df, campaign_sequences, campaign_stats=campaign_row)
@@ -77,10 +77,15 @@ def render_filters(campaigns_df: pd.DataFrame) -> Tuple[str, datetime, datetime,
         
         return selected_workspace, start_date, end_date, selected_campaigns
 
-def render_workspace_filters(campaigns_df: pd.DataFrame) -> str:
+def render_workspace_filters(campaigns_df: pd.DataFrame, workspaces: Optional[List[str]] = None) -> str:
     """
     Render workspace filter only for workspace overview tab.
     
+    Args:
+        campaigns_df: DataFrame containing campaign data
+        workspaces: Precomputed workspace options (including "All Workspaces");
+            derived from campaigns_df when omitted
+    
     Returns:
         Tuple of (selected_workspace, start_date, end_date)
     """
@@ -88,10 +93,11 @@ def render_workspace_filters(campaigns_df: pd.DataFrame) -> str:
 
         
         # Extract unique workspaces
-        workspaces = ["All Workspaces"]
-        if not campaigns_df.empty and 'workspace_name' in campaigns_df.columns:
-            unique_ws = sorted(campaigns_df['workspace_name'].dropna().unique().tolist())
-            workspaces.extend(unique_ws)
+        if workspaces is None:
+            workspaces = ["All Workspaces"]
+            if not campaigns_df.empty and 'workspace_name' in campaigns_df.columns:
+                unique_ws = sorted(campaigns_df['workspace_name'].dropna().unique().tolist())
+                workspaces.extend(unique_ws)
         
         # Workspace Filter
         selected_workspace = st.selectbox(
@@ -136,7 +142,12 @@ def render_workspace_filters(campaigns_df: pd.DataFrame) -> str:
         
         return selected_workspace, start_date, end_date
 
-def render_campaign_filters(campaigns_df: pd.DataFrame, workspace: Optional[str] = None, on_change: Optional[callable] = None) -> Tuple[str, datetime, datetime]:
+def render_campaign_filters(
+    campaigns_df: pd.DataFrame,
+    workspace: Optional[str] = None,
+    on_change: Optional[callable] = None,
+    available_campaigns: Optional[List[str]] = None
+) -> Tuple[str, datetime, datetime]:
     """
     Render campaign selector and date range filter for campaign analysis tab.
     
@@ -144,6 +155,8 @@ def render_campaign_filters(campaigns_df: pd.DataFrame, workspace: Optional[str]
         campaigns_df: DataFrame containing campaign data
         workspace: Optional workspace filter to apply
         on_change: Callback function to trigger when campaign is selected
+        available_campaigns: Precomputed sorted campaign names for the
+            workspace; derived from campaigns_df when omitted
     
     Returns:
         Tuple of (selected_campaign, start_date, end_date)
@@ -151,15 +164,16 @@ def render_campaign_filters(campaigns_df: pd.DataFrame, workspace: Optional[str]
     with st.sidebar:
 
         
-        # Filter campaigns by workspace if provided
-        filtered_campaigns_df = campaigns_df
-        if workspace and workspace != "All Workspaces" and not campaigns_df.empty:
-            filtered_campaigns_df = campaigns_df[campaigns_df['workspace_name'] == workspace]
-        
-        # Campaign selector
-        available_campaigns = []
-        if not filtered_campaigns_df.empty and 'Name' in filtered_campaigns_df.columns:
-            available_campaigns = sorted(filtered_campaigns_df['Name'].dropna().unique().tolist())
+        if available_campaigns is None:
+            # Filter campaigns by workspace if provided
+            filtered_campaigns_df = campaigns_df
+            if workspace and workspace != "All Workspaces" and not campaigns_df.empty:
+                filtered_campaigns_df = campaigns_df[campaigns_df['workspace_name'] == workspace]
+            
+            # Campaign selector
+            available_campaigns = []
+            if not filtered_campaigns_df.empty and 'Name' in filtered_campaigns_df.columns:
+                available_campaigns = sorted(filtered_campaigns_df['Name'].dropna().unique().tolist())
         
         # Validate current selection against available options to prevent KeyErrors
         if "campaign_filter" in st.session_state:
@@ -1,5 +1,6 @@
 import pandas as pd
-from typing import List, Dict
+import pyarrow as pa
+from typing import List, Dict, Union
 from datetime import datetime
 import streamlit as st
 
@@ -33,12 +34,15 @@ class DataProcessor:
         return df
     
     @staticmethod
-    def process_leads(leads_data: List[Dict]) -> pd.DataFrame:
-        """Convert lead dictionaries to DataFrame and clean types"""
-        if not leads_data:
+    def process_leads(leads_data: Union[pa.Table, List[Dict]]) -> pd.DataFrame:
+        """Convert leads (Arrow table or list of dictionaries) to DataFrame and clean types"""
+        if leads_data is None or len(leads_data) == 0:
             return pd.DataFrame()
             
-        df = pd.DataFrame(leads_data)
+        if isinstance(leads_data, pa.Table):
+            df = leads_data.to_pandas()
+        else:
+            df = pd.DataFrame(leads_data)
         
         # Normalize columns: Supabase might be lowercase
         # Map: lowercase -> Expected Capitalized
@@ -80,9 +84,21 @@ class DataProcessor:
             if col in df.columns:
                 df[col] = df[col].astype(str).str.strip()
         
-        # Date conversion
+        # astype(str) turns missing bounce types into 'None'/'nan'; store real
+        # NaN once so consumers can just dropna()/notna()
+        bounce_type = df['bounce_type']
+        df['bounce_type'] = bounce_type.mask(bounce_type.str.lower().isin(['', 'none', 'nan', 'null']))
+        
+        # Few distinct labels: counts and groupbys work on category codes
+        for col in string_cols:
+            if col in df.columns:
+                df[col] = df[col].astype('category')
+        
+        # Date conversion: naive UTC datetime64 so date filters are a plain
+        # comparison, sorted so they can binary search the range
         if 'Date' in df.columns:
-            df['Date'] = pd.to_datetime(df['Date'], errors='coerce')
+            df['Date'] = pd.to_datetime(df['Date'], errors='coerce', utc=True).dt.tz_localize(None)
+            df = df.sort_values('Date', kind='stable', ignore_index=True)
         
         return df
 
@@ -198,6 +214,10 @@ class DataProcessor:
              # If mapping failed and name is missing completely
              df['Name'] = 'Unknown Campaign'
 
+        # Few distinct workspaces: equality filters compare category codes
+        if 'workspace_name' in df.columns:
+            df['workspace_name'] = df['workspace_name'].astype('category')
+
         # Recalculate Rates to ensure they are floats and correct
         # total_reply_rate
         if 'total_replies' in df.columns and 'leads_contacted' in df.columns:
@@ -257,6 +277,9 @@ class DataProcessor:
                 df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
             else:
                 df[col] = 0
+        
+        # Same integer dtype as campaigns/leads so lookups are a typed equality
+        df['campaign_id'] = df['campaign_id'].astype('int64')
                 
         # Boolean columns
         # variant and thread_reply are Single Select(True/False) so they might come as strings "True"/"False" or simple booleans
@@ -5,8 +5,9 @@ This module handles all database operations for email campaigns,
 leads, and sequences using the unified database client.
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Union
 import pandas as pd
+import pyarrow as pa
 import streamlit as st
 
 from core.database import get_database_client
@@ -40,19 +41,39 @@ class EmailRepository:
             return []
     
     @st.cache_data(ttl=config.CACHE_TTL)
-    def get_leads(_self) -> List[Dict]:
+    def get_leads(_self) -> Union[pa.Table, List[Dict]]:
         """
         Fetch all email leads.
         
+        The rows still arrive as JSON records; they are converted to a
+        columnar Arrow table once per cache fill, which DataProcessor turns
+        into a DataFrame with Table.to_pandas().
+        
         Returns:
-            List of lead dictionaries
+            Arrow table of leads, or the same list of lead dictionaries if
+            the rows cannot be represented as a typed Arrow table or have
+            list-valued columns
         """
         try:
-            return _self.db.fetch_all(_self.leads_table)
+            records = _self.db.fetch_all(_self.leads_table)
         except Exception as e:
             logger.error(f"Error fetching leads: {e}")
             st.error(f"Failed to load leads: {str(e)}")
             return []
+        
+        try:
+            table = pa.Table.from_pylist(records)
+        except pa.ArrowException as e:
+            # Mixed-type column: keep the records already fetched
+            logger.warning(f"Falling back to row records for leads: {e}")
+            return records
+        
+        # Linked-record columns (e.g. campaign_id as [5]) come back from
+        # to_pandas() as numpy arrays, which DataProcessor's list unwrap
+        # does not handle: keep the records for those
+        if any(pa.types.is_list(f.type) or pa.types.is_large_list(f.type) for f in table.schema):
+            return records
+        return table
     
     @st.cache_data(ttl=config.CACHE_TTL)
     def get_sequences(_self) -> List[Dict]:
@@ -68,3 +89,14 @@ class EmailRepository:
             logger.error(f"Error fetching sequences: {e}")
             st.error(f"Failed to load sequences: {str(e)}")
             return []
+
+
+@st.cache_resource
+def get_email_repository() -> EmailRepository:
+    """
+    Get the process-wide email repository instance.
+    
+    Returns:
+        Shared EmailRepository instance
+    """
+    return EmailRepository()
@@ -0,0 +1,105 @@
+"""
+Sender ESP x lead ESP reply counts computed from categorical codes.
+
+The ESP columns are categoricals (see DataProcessor.process_leads), so every
+(sender, lead) pair maps to a flat cell index and the counts are a weighted
+bincount rather than a hash groupby. numba is an optional accelerator: when it
+is installed, very large frames use a parallel kernel instead of np.bincount.
+"""
+
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    from numba import get_num_threads, njit, prange
+except ImportError:  # numba not installed: numpy path only
+    njit = None
+
+# Below this many rows np.bincount is already fast enough
+NUMBA_MIN_ROWS = 200_000
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _crosstab_kernel(cell, is_reply, is_human, n_cells, n_chunks):
+        # One accumulator per chunk so parallel iterations never write the
+        # same cell, then a serial reduction
+        out = np.zeros((n_chunks, 3, n_cells), dtype=np.int64)
+        chunk = (cell.size + n_chunks - 1) // n_chunks
+        for c in prange(n_chunks):
+            stop = min((c + 1) * chunk, cell.size)
+            for i in range(c * chunk, stop):
+                k = cell[i]
+                if k >= 0:
+                    out[c, 0, k] += 1
+                    out[c, 1, k] += is_reply[i]
+                    out[c, 2, k] += is_human[i]
+        totals = np.zeros((3, n_cells), dtype=np.int64)
+        for c in range(n_chunks):
+            totals += out[c]
+        return totals
+else:
+    _crosstab_kernel = None
+
+
+def _cell_counts(cell: np.ndarray, is_reply: np.ndarray, is_human: np.ndarray, n_cells: int) -> np.ndarray:
+    """Return a (3, n_cells) array of row, reply and human reply counts."""
+    if _crosstab_kernel is not None and cell.size >= NUMBA_MIN_ROWS:
+        return _crosstab_kernel(cell, is_reply, is_human, n_cells, get_num_threads())
+
+    keep = cell >= 0
+    cell = cell[keep]
+    return np.vstack([
+        np.bincount(cell, minlength=n_cells),
+        np.bincount(cell, weights=is_reply[keep], minlength=n_cells).astype(np.int64),
+        np.bincount(cell, weights=is_human[keep], minlength=n_cells).astype(np.int64),
+    ])
+
+
+def esp_reply_crosstab(
+    sender: pd.Series,
+    lead: pd.Series,
+    is_reply: np.ndarray,
+    is_human: np.ndarray
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Sum reply indicators per (sender ESP, lead ESP) pair.
+
+    Equivalent to grouping the indicators by both columns with
+    observed=True and unstacking with fill_value=0: rows with a missing ESP
+    are skipped, and only ESPs that occur in a complete pair are kept.
+
+    Args:
+        sender: Categorical sender_inbox_esp column
+        lead: Categorical lead_esp column
+        is_reply: int8 reply indicator per row
+        is_human: int8 human reply indicator per row
+
+    Returns:
+        Tuple of (reply counts, human reply counts) indexed by sender ESP
+        with one column per lead ESP
+    """
+    n_sender = len(sender.cat.categories)
+    n_lead = len(lead.cat.categories)
+    sender_codes = sender.cat.codes.to_numpy()
+    lead_codes = lead.cat.codes.to_numpy()
+
+    # Flat cell per row; -1 (missing ESP) marks rows to skip
+    cell = np.where(
+        (sender_codes >= 0) & (lead_codes >= 0),
+        sender_codes.astype(np.int64) * n_lead + lead_codes,
+        -1
+    )
+    rows, replies, humans = _cell_counts(cell, is_reply, is_human, n_sender * n_lead).reshape(3, n_sender, n_lead)
+
+    seen_sender = rows.sum(axis=1) > 0
+    seen_lead = rows.sum(axis=0) > 0
+    index = pd.Index(sender.cat.categories[seen_sender], name=sender.name)
+    columns = pd.Index(lead.cat.categories[seen_lead], name=lead.name)
+
+    def _table(counts: np.ndarray) -> pd.DataFrame:
+        return pd.DataFrame(counts[np.ix_(seen_sender, seen_lead)], index=index, columns=columns)
+
+    return _table(replies), _table(humans)
@@ -152,13 +152,66 @@ def calculate_campaign_kpis(campaign_row: pd.Series) -> Dict[str, float]:
         "objection": int(get_val('objection'))
     }
 
-def calculate_filtered_kpis(campaign_row: pd.Series, filtered_leads_df: pd.DataFrame) -> Dict[str, float]:
+def calculate_all_campaign_kpis(campaigns_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Calculate campaign KPIs for every campaign at once.
+    
+    Column-wise equivalent of calculate_campaign_kpis, so a selection
+    change is a lookup instead of a per-row computation.
+    
+    Args:
+        campaigns_df: Processed campaigns dataframe
+    
+    Returns:
+        DataFrame indexed by campaign_id with one column per KPI key
+    """
+    if campaigns_df.empty or 'campaign_id' not in campaigns_df.columns:
+        return pd.DataFrame()
+
+    def get_col(key):
+        if key in campaigns_df.columns:
+            return campaigns_df[key]
+        return pd.Series(0, index=campaigns_df.index)
+
+    # Handle both spellings for interested
+    interested_replies = get_col('interested_semantic') if 'interested_semantic' in campaigns_df.columns else get_col('interested_sementic')
+    interested_rate = get_col('semantic_interested_reply_rate') if 'semantic_interested_reply_rate' in campaigns_df.columns else get_col('sementic_interested_reply_rate')
+
+    kpis = pd.DataFrame({
+        "total_sent": get_col('emails_sent'),
+        "total_contacted": get_col('leads_contacted'),
+        "overall_reply_rate": get_col('total_reply_rate') * 100,
+        "bounce_rate": get_col('bounce_rate') * 100,
+        "replies": get_col('total_replies'),
+        "bounces": get_col('bounced'),
+        "human_reply_rate": get_col('human_reply_rate') * 100,
+        "human_replies": get_col('human_reply'),
+        "interested_rate": interested_rate * 100,
+        "interested_replies": interested_replies,
+        "not_interested_rate": get_col('not_interested_reply_rate') * 100,
+        "not_interested_replies": get_col('not_interested').astype(int),
+        "automated_rate": get_col('automated_reply_rate') * 100,
+        "automated_replies": get_col('automated_replies').astype(int),
+        "objection_rate": get_col('objection_rate') * 100,
+        "objection": get_col('objection').astype(int)
+    })
+    kpis.index = campaigns_df['campaign_id']
+    return kpis[~kpis.index.duplicated()]
+
+def calculate_filtered_kpis(
+    campaign_row: pd.Series,
+    filtered_leads_df: pd.DataFrame,
+    campaign_kpis: Optional[Dict[str, float]] = None
+) -> Dict[str, float]:
     """
     Calculate KPIs based on filtered leads, but keep total sent/contacted from campaign.
     
     Args:
         campaign_row: The campaign data (for total counts)
         filtered_leads_df: The leads filtered by date
+        campaign_kpis: Precomputed unfiltered KPIs for the campaign, e.g. a
+            row of calculate_all_campaign_kpis; computed from campaign_row
+            when omitted
         
     Returns:
         Dictionary of KPIs
@@ -251,8 +304,10 @@ def calculate_filtered_kpis(campaign_row: pd.Series, filtered_leads_df: pd.DataF
     # "status everything column... from leads table".
     # I'll just use the overall bounce rate from campaign_row to be safe, filtering only replies.
     
-    bounce_rate = calculate_campaign_kpis(campaign_row)['bounce_rate']
-    total_bounces = calculate_campaign_kpis(campaign_row)['bounces']
+    if campaign_kpis is None:
+        campaign_kpis = calculate_campaign_kpis(campaign_row)
+    bounce_rate = campaign_kpis['bounce_rate']
+    total_bounces = campaign_kpis['bounces']
 
     return {
         "total_sent": total_sent,
@@ -1,12 +1,241 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
-def render_lead_status_analysis(leads_df):
-    """Render lead status distribution and analysis"""
-    if leads_df.empty or 'Status' not in leads_df.columns:
+# Figures are built in st.cache_data helpers from small aggregated inputs, so a
+# rerun on unchanged data (widget clicks, metric radio) only re-sends the
+# cached figure instead of rebuilding traces and layout.
+_FIGURE_CACHE_ENTRIES = 32
+
+
+@st.cache_data(max_entries=_FIGURE_CACHE_ENTRIES, show_spinner=False)
+def _build_status_pie(status_counts: dict) -> go.Figure:
+    """Build the lead status donut from a {status: count} mapping."""
+    statuses = list(status_counts)
+    
+    # Build color map: green for Interested, RdBu palette for rest
+    rdbu = px.colors.sequential.RdBu
+    other_statuses = [s for s in statuses if s != 'Interested']
+    status_color_map = {'Interested': '#059669'}
+    for i, s in enumerate(other_statuses):
+        status_color_map[s] = rdbu[i % len(rdbu)]
+
+    fig = px.pie(
+        values=list(status_counts.values()),
+        names=statuses,
+        title="Lead Status Distribution",
+        hole=0.7,
+        color=statuses,
+        color_discrete_map=status_color_map
+    )
+    fig.update_traces(textposition='inside', textinfo='percent')
+    fig.update_layout(
+        height=300, 
+        margin=dict(l=30, r=30, t=60, b=30),
+        title=dict(font=dict(size=14))
+    )
+    return fig
+
+
+@st.cache_data(max_entries=_FIGURE_CACHE_ENTRIES, show_spinner=False)
+def _build_accounts_bar(display_stats: pd.DataFrame, top_n, height: int) -> go.Figure:
+    """Build the horizontal interested-leads bar per account."""
+    fig = px.bar(
+        display_stats,
+        y='Account',
+        x='Interested Leads',
+        orientation='h',
+        title=f"Accounts by Interested Leads ({top_n if top_n != 'All' else 'All'})",
+        color='Interest Rate %',
+        color_continuous_scale='Viridis',
+        text='Interested Leads'
+    )
+    fig.update_traces(texttemplate='%{text}', textposition='outside', marker_line_width=0, marker_cornerradius=8)
+    fig.update_layout(
+        height=height, 
+        margin=dict(l=20, r=20, t=50, b=30), 
+        yaxis={'categoryorder': 'total ascending'},
+        title=dict(font=dict(size=14))
+    )
+    return fig
+
+
+@st.cache_data(max_entries=_FIGURE_CACHE_ENTRIES, show_spinner=False)
+def _build_seniority_bar(seniority_stats: pd.DataFrame) -> go.Figure:
+    """Build the interest rate by seniority level bar."""
+    fig = px.bar(
+        seniority_stats,
+        x='Interest Rate %',
+        y='Seniority Level',
+        orientation='h',
+        title="Interest Rate by Seniority Level",
+        color='Total Leads',
+        color_continuous_scale='Blues',
+        text='Interest Rate %'
+    )
+    fig.update_traces(
+        texttemplate='%{text:.1f}%',
+        textposition='outside',
+        marker_line_width=0,
+        marker_cornerradius=8
+    )
+    fig.update_layout(
+        height=300,
+        margin=dict(l=20, r=20, t=60, b=20),
+        title=dict(font=dict(size=14))
+    )
+    return fig
+
+
+@st.cache_data(max_entries=_FIGURE_CACHE_ENTRIES, show_spinner=False)
+def _daily_reply_stats(timeline_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Count replies and reply statuses per day, with missing days filled with 0.
+    
+    Args:
+        timeline_df: reply_date (datetime64), lead_id and Status of leads
+            with a reply date
+        
+    Returns:
+        DataFrame with Date, Replies, Interested, Not Interested, Objection
+        and Revisit Later columns
+    """
+    status = timeline_df['Status']
+    timeline_df = timeline_df.assign(
+        date=timeline_df['reply_date'].dt.floor('D'),
+        _interested=(status == 'Interested').astype('int8'),
+        _not_interested=(status == 'Not Interested').astype('int8'),
+        _objection=status.isin(['Objection', 'Objections']).astype('int8'),
+        _revisit=status.astype(str).str.contains('Revisit', case=False, na=False).astype('int8')
+    )
+    
+    # --- Data Processing for All Metrics ---
+    # Group by date and sum the precomputed indicators (no per-group lambdas)
+    daily_data = timeline_df.groupby('date').agg(
+        replies=('lead_id', 'count'), # Total Replies
+        interested=('_interested', 'sum'),
+        not_interested=('_not_interested', 'sum'),
+        objection=('_objection', 'sum'),
+        revisit=('_revisit', 'sum')
+    ).reset_index()
+    
+    # Flatten MultiIndex columns
+    daily_data.columns = ['Date', 'Replies', 'Interested', 'Not Interested', 'Objection', 'Revisit Later']
+    
+    # Ensure all dates in range are present (fill gaps with 0)
+    min_date = daily_data['Date'].min()
+    max_date = daily_data['Date'].max()
+    all_dates = pd.date_range(start=min_date, end=max_date, freq='D')
+    
+    daily_data = daily_data.set_index('Date').reindex(all_dates, fill_value=0).reset_index()
+    daily_data.rename(columns={'index': 'Date'}, inplace=True)
+    return daily_data
+
+
+@st.cache_data(max_entries=_FIGURE_CACHE_ENTRIES, show_spinner=False)
+def _build_analytics_figure(series_df: pd.DataFrame, metric_name: str, chart_color: str) -> go.Figure:
+    """
+    Build the single-metric area chart of the Analytics section.
+    
+    Args:
+        series_df: Date column plus the selected metric column
+        metric_name: Selected metric (column and trace name)
+        chart_color: Hex line color
+    """
+    # Plotly Chart
+    fig = go.Figure()
+    
+    # Add Gradient Area Trace
+    fig.add_trace(go.Scatter(
+        x=series_df['Date'],
+        y=series_df[metric_name],
+        mode='lines',
+        name=metric_name,
+        line=dict(color=chart_color, width=3, shape='spline', smoothing=1.3),
+        fill='tozeroy',
+        # Create a gradient effect using rgba
+        fillcolor=f"rgba({int(chart_color[1:3], 16)}, {int(chart_color[3:5], 16)}, {int(chart_color[5:7], 16)}, 0.1)" 
+    ))
+    
+    # Add Markers for non-zero points only to keep it clean, or just hover points
+    # Let's add specific markers for the checked point style
+    fig.add_trace(go.Scatter(
+        x=series_df['Date'],
+        y=series_df[metric_name],
+        mode='markers',
+        marker=dict(
+            size=8,
+            color='white',
+            line=dict(color=chart_color, width=2)
+        ),
+        showlegend=False,
+        hoverinfo='skip' # The line trace handles hover better
+    ))
+
+    # Layout Updates for "High Tech" / Clean Look
+    fig.update_layout(
+        template='plotly_white',
+        height=300,
+        margin=dict(l=10, r=10, t=20, b=10),
+        xaxis=dict(
+            showgrid=False,
+            showline=False,
+            zeroline=False,
+            tickformat="%b %d",
+            tickfont=dict(color='#94a3b8', size=11),
+            fixedrange=True
+        ),
+        yaxis=dict(
+            showgrid=True,
+            gridcolor='#f1f5f9',
+            gridwidth=1,
+            zeroline=False,
+            showticklabels=True,
+            tickfont=dict(color='#94a3b8', size=11),
+            fixedrange=True
+        ),
+        hovermode='x unified',
+        hoverlabel=dict(
+            bgcolor='white',
+            font_size=13,
+            font_family="Inter, sans-serif",
+            bordercolor=chart_color
+        ),
+        showlegend=False
+    )
+    return fig
+
+
+@st.cache_data(max_entries=_FIGURE_CACHE_ENTRIES, show_spinner=False)
+def _build_funnel(counts: tuple) -> go.Figure:
+    """Build the conversion funnel from (sent, accepted, replied, interested)."""
+    funnel_data = pd.DataFrame({
+        'Stage': ['Sent', 'Accepted', 'Replied', 'Interested'],
+        'Count': list(counts)
+    })
+    
+    fig = px.funnel(
+        funnel_data,
+        x='Count',
+        y='Stage',
+        title="Complete Conversion Funnel"
+    )
+    fig.update_layout(height=400)
+    return fig
+
+
+def render_lead_status_analysis(counts: dict, total_leads: int):
+    """
+    Render lead status distribution and analysis.
+    
+    Args:
+        counts: {status: count} from build_aggregates
+        total_leads: Number of leads the counts were taken from
+    """
+    if not counts:
         st.info("No lead status data available")
         return
     
@@ -16,36 +245,13 @@ def render_lead_status_analysis(leads_df):
     
     with col1:
         # Pie chart of status distribution
-        status_counts = leads_df['Status'].value_counts()
-        
-        # Build color map: green for Interested, RdBu palette for rest
-        rdbu = px.colors.sequential.RdBu
-        other_statuses = [s for s in status_counts.index if s != 'Interested']
-        status_color_map = {'Interested': '#059669'}
-        for i, s in enumerate(other_statuses):
-            status_color_map[s] = rdbu[i % len(rdbu)]
-
-        fig = px.pie(
-            values=status_counts.values,
-            names=status_counts.index,
-            title="Lead Status Distribution",
-            hole=0.7,
-            color=status_counts.index,
-            color_discrete_map=status_color_map
-        )
-        fig.update_traces(textposition='inside', textinfo='percent')
-        fig.update_layout(
-            height=300, 
-            margin=dict(l=30, r=30, t=60, b=30),
-            title=dict(font=dict(size=14))
-        )
+        fig = _build_status_pie(counts)
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
         # Status metrics
-        total_leads = len(leads_df)
-        interested = len(leads_df[leads_df['Status'] == 'Interested']) if 'Interested' in leads_df['Status'].values else 0
-        not_interested = len(leads_df[leads_df['Status'] == 'Not Interested']) if 'Not Interested' in leads_df['Status'].values else 0
+        interested = counts.get('Interested', 0)
+        not_interested = counts.get('Not Interested', 0)
         
         st.metric("Total Leads", f"{total_leads:,}")
         st.metric("Interested Leads", f"{interested:,}", 
@@ -54,8 +260,13 @@ def render_lead_status_analysis(leads_df):
                  delta=f"{(not_interested/total_leads*100):.1f}%" if total_leads > 0 else "0%",
                  delta_color="inverse")
 
+@st.fragment
 def render_top_accounts(leads_df, accounts_df=None):
-    """Render top performing accounts analysis"""
+    """
+    Render top performing accounts analysis.
+    
+    Runs as a fragment: the "Show Top" selector reruns only this section.
+    """
     if leads_df.empty or 'account_name' not in leads_df.columns:
         st.info("No account data available")
         return
@@ -63,7 +274,7 @@ def render_top_accounts(leads_df, accounts_df=None):
     st.subheader("🏆 Top Performing Accounts")
     
     # Filter out deleted accounts if accounts_df is provided
-    filtered_leads = leads_df.copy()
+    filtered_leads = leads_df
     if accounts_df is not None and not accounts_df.empty and 'account_id' in accounts_df.columns:
         # Filter accounts where status is NOT 'DELETED'
         active_accounts = accounts_df[accounts_df['status'].str.upper() != 'DELETED']
@@ -77,11 +288,12 @@ def render_top_accounts(leads_df, accounts_df=None):
         return
 
     # Aggregate by account
-    account_stats = filtered_leads.groupby('account_name').agg({
-        'lead_id': 'count',
-        'replies': 'sum',
-        'Status': lambda x: (x == 'Interested').sum()
-    }).reset_index()
+    filtered_leads = filtered_leads.assign(_interested=(filtered_leads['Status'] == 'Interested').astype('int8'))
+    account_stats = filtered_leads.groupby('account_name', observed=True).agg(
+        lead_id=('lead_id', 'count'),
+        replies=('replies', 'sum'),
+        interested=('_interested', 'sum')
+    ).reset_index()
     
     account_stats.columns = ['Account', 'Total Leads', 'Total Replies', 'Interested Leads']
     account_stats['Interest Rate %'] = (account_stats['Interested Leads'] / account_stats['Total Leads'] * 100).round(2)
@@ -118,24 +330,7 @@ def render_top_accounts(leads_df, accounts_df=None):
     
     with col1:
         # Horizontal bar chart
-        fig = px.bar(
-            display_stats,
-            y='Account',
-            x='Interested Leads',
-            orientation='h',
-            title=f"Accounts by Interested Leads ({top_n if top_n != 'All' else 'All'})",
-            color='Interest Rate %',
-            color_continuous_scale='Viridis',
-            text='Interested Leads'
-        )
-        fig.update_traces(texttemplate='%{text}', textposition='outside', marker_line_width=0, marker_cornerradius=8)
-        fig.update_layout(
-            height=dynamic_height, 
-            margin=dict(l=20, r=20, t=50, b=30), 
-            yaxis={'categoryorder': 'total ascending'},
-            title=dict(font=dict(size=14))
-        )
-        
+        fig = _build_accounts_bar(display_stats, top_n, dynamic_height)
         st.plotly_chart(fig, use_container_width=True)
     
     with col2:
@@ -181,11 +376,17 @@ def render_campaign_effectiveness(campaigns_df, leads_df):
     
     with col1:
         # Scatter plot: Acceptance Rate vs Reply Rate
-        campaigns_df['acceptance_rate'] = (campaigns_df['accepted_connections'] / campaigns_df['sent_connections'] * 100).fillna(0)
-        campaigns_df['reply_rate'] = (campaigns_df['replies'] / campaigns_df['sent_messages'] * 100).fillna(0)
+        # Rates go on a narrow local frame so the caller's frame is not mutated
+        df = campaigns_df[['accepted_connections', 'sent_connections', 'replies', 'sent_messages', 'outreach_type', 'campaign_name']].copy()
+        # Zero denominators give 0% directly: np.maximum keeps the division
+        # warning-free instead of producing NaN/inf and filling afterwards
+        sent = df['sent_connections'].to_numpy()
+        sent_msgs = df['sent_messages'].to_numpy()
+        df['acceptance_rate'] = np.where(sent > 0, df['accepted_connections'].to_numpy() / np.maximum(sent, 1) * 100, 0.0).astype(np.float32)
+        df['reply_rate'] = np.where(sent_msgs > 0, df['replies'].to_numpy() / np.maximum(sent_msgs, 1) * 100, 0.0).astype(np.float32)
         
         fig = px.scatter(
-            campaigns_df,
+            df,
             x='acceptance_rate',
             y='reply_rate',
             size='sent_connections',
@@ -204,7 +405,7 @@ def render_campaign_effectiveness(campaigns_df, leads_df):
     with col2:
         # Outreach type comparison
         if 'outreach_type' in campaigns_df.columns:
-            outreach_stats = campaigns_df.groupby('outreach_type').agg({
+            outreach_stats = campaigns_df.groupby('outreach_type', observed=True).agg({
                 'sent_connections': 'sum',
                 'accepted_connections': 'sum',
                 'replies': 'sum'
@@ -271,7 +472,9 @@ def render_seniority_level_analysis(leads_df):
 
     st.subheader("💼 Seniority Level Insights")
 
-    df_analysis = leads_df.copy()
+    # Only the columns the aggregation reads
+    source_col = 'Seniority' if has_seniority_col else 'job_title'
+    df_analysis = leads_df[['lead_id', 'Status', source_col]].copy()
 
     if has_seniority_col:
         # Primary path: use the Seniority column directly
@@ -294,9 +497,10 @@ def render_seniority_level_analysis(leads_df):
         return
 
     # Aggregate stats by Seniority
+    df_analysis = df_analysis.assign(_interested=(df_analysis['Status'] == 'Interested').astype('int8'))
     seniority_stats = df_analysis.groupby('_seniority').agg(
         Total_Leads=('lead_id', 'count'),
-        Interested=('Status', lambda x: (x == 'Interested').sum())
+        Interested=('_interested', 'sum')
     ).reset_index()
 
     seniority_stats.columns = ['Seniority Level', 'Total Leads', 'Interested']
@@ -310,27 +514,7 @@ def render_seniority_level_analysis(leads_df):
     col1, col2 = st.columns([2, 1])
 
     with col1:
-        fig = px.bar(
-            seniority_stats,
-            x='Interest Rate %',
-            y='Seniority Level',
-            orientation='h',
-            title="Interest Rate by Seniority Level",
-            color='Total Leads',
-            color_continuous_scale='Blues',
-            text='Interest Rate %'
-        )
-        fig.update_traces(
-            texttemplate='%{text:.1f}%',
-            textposition='outside',
-            marker_line_width=0,
-            marker_cornerradius=8
-        )
-        fig.update_layout(
-            height=300,
-            margin=dict(l=20, r=20, t=60, b=20),
-            title=dict(font=dict(size=14))
-        )
+        fig = _build_seniority_bar(seniority_stats)
         st.plotly_chart(fig, use_container_width=True)
 
     with col2:
@@ -351,8 +535,13 @@ def render_seniority_level_analysis(leads_df):
         for level, pct in dist.head(5).items():
             st.markdown(f"- {level}: {pct:.1f}%")
 
+@st.fragment
 def render_analytics_section(leads_df):
-    """Render advanced analytics section with dynamic chart"""
+    """
+    Render advanced analytics section with dynamic chart.
+    
+    Runs as a fragment: switching the metric reruns only this section.
+    """
     if leads_df.empty or 'reply_date' not in leads_df.columns:
         return
     
@@ -364,35 +553,12 @@ def render_analytics_section(leads_df):
     """, unsafe_allow_html=True)
     
     # Filter out null dates and ensure datetime
-    timeline_df = leads_df[leads_df['reply_date'].notna()].copy()
+    timeline_df = leads_df.loc[leads_df['reply_date'].notna(), ['reply_date', 'lead_id', 'Status']]
     if timeline_df.empty:
         st.info("No timeline data available")
         return
-        
-    timeline_df['date'] = pd.to_datetime(timeline_df['reply_date']).dt.date
-    
-    # --- Data Processing for All Metrics ---
-    # Group by date and calculate counts for each metric
-    daily_data = timeline_df.groupby('date').agg({
-        'lead_id': 'count', # Total Replies
-        'Status': [
-            lambda x: (x == 'Interested').sum(),
-            lambda x: (x == 'Not Interested').sum(),
-            lambda x: x.isin(['Objection', 'Objections']).sum(),
-            lambda x: x.astype(str).str.contains('Revisit', case=False, na=False).sum()
-        ]
-    }).reset_index()
     
-    # Flatten MultiIndex columns
-    daily_data.columns = ['Date', 'Replies', 'Interested', 'Not Interested', 'Objection', 'Revisit Later']
-    
-    # Ensure all dates in range are present (fill gaps with 0)
-    min_date = daily_data['Date'].min()
-    max_date = daily_data['Date'].max()
-    all_dates = pd.date_range(start=min_date, end=max_date, freq='D').date
-    
-    daily_data = daily_data.set_index('Date').reindex(all_dates, fill_value=0).reset_index()
-    daily_data.rename(columns={'index': 'Date'}, inplace=True)
+    daily_data = _daily_reply_stats(timeline_df)
 
     # --- Metric Selection UI ---
     # mapping friendly names to column names and colors
@@ -466,106 +632,33 @@ def render_analytics_section(leads_df):
         </div>
     """, unsafe_allow_html=True)
     
-    # Plotly Chart
-    fig = go.Figure()
-    
-    # Add Gradient Area Trace
-    fig.add_trace(go.Scatter(
-        x=daily_data['Date'],
-        y=daily_data[col_name],
-        mode='lines',
-        name=selected_metric_name,
-        line=dict(color=chart_color, width=3, shape='spline', smoothing=1.3),
-        fill='tozeroy',
-        # Create a gradient effect using rgba
-        fillcolor=f"rgba({int(chart_color[1:3], 16)}, {int(chart_color[3:5], 16)}, {int(chart_color[5:7], 16)}, 0.1)" 
-    ))
-    
-    # Add Markers for non-zero points only to keep it clean, or just hover points
-    # Let's add specific markers for the checked point style
-    fig.add_trace(go.Scatter(
-        x=daily_data['Date'],
-        y=daily_data[col_name],
-        mode='markers',
-        marker=dict(
-            size=8,
-            color='white',
-            line=dict(color=chart_color, width=2)
-        ),
-        showlegend=False,
-        hoverinfo='skip' # The line trace handles hover better
-    ))
-
-    # Layout Updates for "High Tech" / Clean Look
-    fig.update_layout(
-        template='plotly_white',
-        height=300,
-        margin=dict(l=10, r=10, t=20, b=10),
-        xaxis=dict(
-            showgrid=False,
-            showline=False,
-            zeroline=False,
-            tickformat="%b %d",
-            tickfont=dict(color='#94a3b8', size=11),
-            fixedrange=True
-        ),
-        yaxis=dict(
-            showgrid=True,
-            gridcolor='#f1f5f9',
-            gridwidth=1,
-            zeroline=False,
-            showticklabels=True,
-            tickfont=dict(color='#94a3b8', size=11),
-            fixedrange=True
-        ),
-        hovermode='x unified',
-        hoverlabel=dict(
-            bgcolor='white',
-            font_size=13,
-            font_family="Inter, sans-serif",
-            bordercolor=chart_color
-        ),
-        showlegend=False
-    )
+    fig = _build_analytics_figure(daily_data[['Date', col_name]], col_name, chart_color)
     
     st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': False})
     
     st.markdown("</div>", unsafe_allow_html=True)
 
-def render_conversion_funnel(campaigns_df: pd.DataFrame, leads_df: pd.DataFrame):
-    """Render conversion funnel chart"""
+def render_conversion_funnel(funnel_totals: dict):
+    """
+    Render conversion funnel chart.
+    
+    Args:
+        funnel_totals: 'sent', 'accepted', 'replies' and 'interested' counts
+            from build_aggregates (empty when there are no campaigns)
+    """
     
     st.markdown("### 🎯 Conversion Funnel")
     
-    if campaigns_df.empty:
+    if not funnel_totals:
         st.info("No campaign data available")
         return
     
-    total_sent = campaigns_df['sent_connections'].sum()
-    total_accepted = campaigns_df['accepted_connections'].sum()
-    
-    # Count replied leads: where replies is not null and > 0
-    from linkedin.services.metrics import count_replied_leads, get_replied_leads
-    total_replies = count_replied_leads(leads_df)
-    
-    # Get replied leads and count interested
-    replied_leads_df = get_replied_leads(leads_df)
-    interested = 0
-    if not replied_leads_df.empty and 'Status' in replied_leads_df.columns:
-        interested = len(replied_leads_df[replied_leads_df['Status'] == 'Interested'])
-    
-    funnel_data = pd.DataFrame({
-        'Stage': ['Sent', 'Accepted', 'Replied', 'Interested'],
-        'Count': [total_sent, total_accepted, total_replies, interested]
-    })
-    
-    fig = px.funnel(
-        funnel_data,
-        x='Count',
-        y='Stage',
-        title="Complete Conversion Funnel"
-    )
-    fig.update_layout(height=400)
+    fig = _build_funnel((
+        funnel_totals['sent'],
+        funnel_totals['accepted'],
+        funnel_totals['replies'],
+        funnel_totals['interested']
+    ))
     st.plotly_chart(fig, use_container_width=True)
 
 @st.dialog("⚠️ Confirm Deletion")
@@ -590,33 +683,38 @@ def confirm_delete_dialog(campaign_id: str, campaign_name: str, index: int):
     with col1:
         if st.button("✅ Yes, Delete", key=f"confirm_del_{campaign_id}_{index}", type="primary", use_container_width=True):
             # Use the LinkedInCampaignAPI
-            from api.linkedin_api import LinkedInCampaignAPI
-            api = LinkedInCampaignAPI()
+            from api.linkedin_api import get_linkedin_api
+            api = get_linkedin_api()
             
             with st.spinner("Deleting campaign..."):
                 response = api.delete_campaign(str(campaign_id))
             
-            # Handle case where response might be a string (based on user edits/testing)
-            if isinstance(response, str):
-                st.session_state['delete_success'] = response
-                st.rerun()
+            if response.success:
+                from linkedin.data.repository import LinkedInRepository
+                LinkedInRepository.get_campaigns.clear()
+                LinkedInRepository.get_leads.clear()
+                LinkedInRepository.get_filtered.clear()
                 
-            elif isinstance(response, dict) and response.get('success', False):
                 # Store success message from API
-                st.session_state['delete_success'] = response.get('message', 'Campaign deleted successfully')
+                st.session_state['delete_success'] = response.message or 'Campaign deleted successfully'
                 st.rerun()
             else:
                 # Handle error
-                error_message = response.get('message', 'Failed to delete campaign') if isinstance(response, dict) else str(response)
-                st.session_state['delete_error'] = error_message
+                st.session_state['delete_error'] = response.message or 'Failed to delete campaign'
                 st.rerun()
     
     with col2:
         if st.button("❌ Cancel", key=f"cancel_del_{campaign_id}_{index}", use_container_width=True):
             st.rerun()
 
+@st.fragment
 def render_detailed_tables(campaigns_df: pd.DataFrame, leads_df: pd.DataFrame):
-    """Render detailed data tables with enhanced styling"""
+    """
+    Render detailed data tables with enhanced styling.
+    
+    Runs as a fragment so opening the delete dialog does not rebuild the
+    charts; the dialog itself triggers a full rerun once data changes.
+    """
     st.subheader("📋 Detailed Data Tables")
     
     # Custom CSS for styling the Delete button and Status
@@ -5,11 +5,11 @@ This module contains the main LinkedIn dashboard rendering logic.
 """
 
 import streamlit as st
-import pandas as pd
 from datetime import datetime
 
 from linkedin.data.repository import LinkedInRepository
 from linkedin.components.kpi_cards import calculate_linkedin_metrics, render_linkedin_kpi_cards
+from linkedin.services.metrics import build_aggregates
 from linkedin.components.charts import (
     render_lead_status_analysis,
     render_top_accounts,
@@ -18,7 +18,7 @@ from linkedin.components.charts import (
     render_conversion_funnel,
     render_detailed_tables
 )
-from shared.date_utils import get_date_range, filter_dataframe_by_date
+from shared.date_utils import get_date_range
 from shared.sound_utils import get_sound_by_name
 
 
@@ -152,7 +152,6 @@ def render_linkedin_dashboard():
     try:
         repo = LinkedInRepository()
         campaigns_df = repo.get_campaigns()
-        leads_df = repo.get_leads()
     except Exception as e:
         st.error(f"Error loading Linkedin data: {str(e)}")
         return
@@ -164,7 +163,8 @@ def render_linkedin_dashboard():
         # 1. Workspace Filter
         ws_list = ["All Workspaces"]
         if not campaigns_df.empty and 'workspace_name' in campaigns_df.columns:
-            ws_list += sorted(campaigns_df['workspace_name'].dropna().unique().tolist())
+            # Categories are already sorted and exclude missing values
+            ws_list += campaigns_df['workspace_name'].cat.categories.tolist()
             
         selected_ws = st.selectbox("Select Workspace", ws_list, key="li_workspace")
         
@@ -176,7 +176,7 @@ def render_linkedin_dashboard():
         # 2. Campaign Filter
         campaign_list = ["All Campaigns"]
         if not filtered_campaigns_choices.empty and 'campaign_name' in filtered_campaigns_choices.columns:
-             campaign_list += sorted(filtered_campaigns_choices['campaign_name'].dropna().unique().tolist())
+             campaign_list += filtered_campaigns_choices['campaign_name'].cat.remove_unused_categories().cat.categories.tolist()
              
         selected_campaign = st.selectbox("Select Campaign", campaign_list, key="li_campaign")
 
@@ -195,9 +195,12 @@ def render_linkedin_dashboard():
         
         custom_start, custom_end = None, None
         if selected_date_filter == "Custom Date Range":
-            custom_start = st.date_input("📅 Start Date", datetime.now().date(), key="li_start")
+            # Submit both dates together: one rerun per range instead of per input
+            with st.form("li_custom_range"):
+                custom_start = st.date_input("📅 Start Date", datetime.now().date(), key="li_start")
+                custom_end = st.date_input("📅 End Date", datetime.now().date(), key="li_end")
+                st.form_submit_button("Apply", use_container_width=True)
             custom_start = datetime.combine(custom_start, datetime.min.time())
-            custom_end = st.date_input("📅 End Date", datetime.now().date(), key="li_end")
             custom_end = datetime.combine(custom_end, datetime.max.time())
 
         # Get actual date objects
@@ -220,42 +223,24 @@ def render_linkedin_dashboard():
 
 
     # --- Apply Filters to Data ---
-    
-    # Store original data for some comparisons
-    original_campaigns_df = campaigns_df.copy()
-    original_leads_df = leads_df.copy()
-    
-    # Filter 1: Workspace
-    if selected_ws != "All Workspaces":
-        campaigns_df = campaigns_df[campaigns_df['workspace_name'] == selected_ws]
-        
-    # Filter 2: Campaign
-    if selected_campaign != "All Campaigns":
-        campaigns_df = campaigns_df[campaigns_df['campaign_name'] == selected_campaign]
-
-    # Filter Leads based on remaining campaigns
-    if not campaigns_df.empty:
-        valid_ids = campaigns_df['campaign_id'].astype(str).unique()
-        leads_df = leads_df[leads_df['campaign_id'].astype(str).isin(valid_ids)]
-    else:
-        leads_df = pd.DataFrame(columns=leads_df.columns)
+    # Cached on the filter values; see LinkedInRepository.get_filtered
+    campaigns_df, leads_df = repo.get_filtered(
+        None if selected_ws == "All Workspaces" else selected_ws,
+        None if selected_campaign == "All Campaigns" else selected_campaign,
+        selected_date_filter,
+        custom_start,
+        custom_end
+    )
 
-    # Filter 3: Date (Applied to Leads 'reply_date')
-    if selected_date_filter != "All Time" and not leads_df.empty and 'reply_date' in leads_df.columns:
-        leads_df = filter_dataframe_by_date(leads_df, 'reply_date', start_date, end_date)
-
-    # Filter: Only include leads that have replied
-    if not leads_df.empty and 'replies' in leads_df.columns:
-        leads_df = leads_df[leads_df['replies'] > 0]
+    # Totals shared by the KPI cards, funnel and status analysis
+    agg = build_aggregates(campaigns_df, leads_df)
 
     # --- KPI Cards Section ---
     metrics = calculate_linkedin_metrics(campaigns_df)
     
     # ALWAYS calculate total replies from leads table
     # Count leads where replies is not null and > 0
-    from linkedin.services.metrics import count_replied_leads, get_replied_leads
-    
-    total_replied_count = count_replied_leads(leads_df)
+    total_replied_count = agg['replied_count']
     metrics['replies'] = total_replied_count
     
     # Recalculate reply rate with correct count
@@ -263,9 +248,6 @@ def render_linkedin_dashboard():
         metrics['reply_rate'] = (total_replied_count / metrics['sent_messages'] * 100)
 
     # Calculate Interested Metrics for KPIs using only replied leads
-    # Get only leads that have actually replied (replies > 0 and not null)
-    replied_leads_df = get_replied_leads(leads_df)
-    
     metrics['interested'] = 0
     metrics['interested_reply_rate'] = 0.0
 
@@ -278,20 +260,20 @@ def render_linkedin_dashboard():
     metrics['not_interested'] = 0
     metrics['not_interested_reply_rate'] = 0.0
     
-    total_replied = len(replied_leads_df)
+    status_counts = agg['status_counts']
     
-    if not replied_leads_df.empty and 'Status' in replied_leads_df.columns:
-        metrics['interested'] = len(replied_leads_df[replied_leads_df['Status'] == 'Interested'])
-        metrics['objection'] = len(replied_leads_df[replied_leads_df['Status'].isin(['Objection', 'Objections'])])
-        metrics['revisit'] = len(replied_leads_df[replied_leads_df['Status'] == 'Revisit Later'])
-        metrics['not_interested'] = len(replied_leads_df[replied_leads_df['Status'] == 'Not Interested'])
+    if status_counts:
+        metrics['interested'] = status_counts.get('Interested', 0)
+        metrics['objection'] = status_counts.get('Objection', 0) + status_counts.get('Objections', 0)
+        metrics['revisit'] = status_counts.get('Revisit Later', 0)
+        metrics['not_interested'] = status_counts.get('Not Interested', 0)
         
         # Calculate rates based on total replied leads (not all leads)
-        if total_replied > 0:
-            metrics['interested_reply_rate'] = (metrics['interested'] / total_replied * 100)
-            metrics['objection_reply_rate'] = (metrics['objection'] / total_replied * 100)
-            metrics['revisit_reply_rate'] = (metrics['revisit'] / total_replied * 100)
-            metrics['not_interested_reply_rate'] = (metrics['not_interested'] / total_replied * 100)
+        if total_replied_count > 0:
+            metrics['interested_reply_rate'] = (metrics['interested'] / total_replied_count * 100)
+            metrics['objection_reply_rate'] = (metrics['objection'] / total_replied_count * 100)
+            metrics['revisit_reply_rate'] = (metrics['revisit'] / total_replied_count * 100)
+            metrics['not_interested_reply_rate'] = (metrics['not_interested'] / total_replied_count * 100)
 
     
     render_linkedin_kpi_cards(metrics)
@@ -302,11 +284,11 @@ def render_linkedin_dashboard():
     
     # Section 1: Conversion Funnel & Lead Status
     st.markdown("## 🎯 Performance Overview")
-    render_conversion_funnel(campaigns_df, leads_df)
+    render_conversion_funnel(agg['funnel_totals'])
     
     st.divider()
     
-    render_lead_status_analysis(leads_df)
+    render_lead_status_analysis(status_counts, total_replied_count)
     
     st.divider()
     
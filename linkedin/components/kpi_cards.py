@@ -15,12 +15,17 @@ def calculate_linkedin_metrics(df: pd.DataFrame) -> dict:
     # Note: For total_replies, we should count from leads table where replies > 0
     # This function receives campaigns_df, so we use the aggregated value
     # The dashboard will override this with the correct count from leads
-    total_sent_connections = df['sent_connections'].sum()
-    total_accepted_connections = df['accepted_connections'].sum()
-    total_sent_messages = df['sent_messages'].sum()
-    total_replies = df['replies'].sum()  # This will be overridden by dashboard
-    total_sent_inmails = df['sent_inmails'].sum()
-    total_inmail_replies = df['inmail_replies'].sum()
+    # One multi-column reduction instead of a sum() per column
+    totals = df[[
+        'sent_connections', 'accepted_connections', 'sent_messages',
+        'replies', 'sent_inmails', 'inmail_replies'
+    ]].sum()
+    total_sent_connections = totals['sent_connections']
+    total_accepted_connections = totals['accepted_connections']
+    total_sent_messages = totals['sent_messages']
+    total_replies = totals['replies']  # This will be overridden by dashboard
+    total_sent_inmails = totals['sent_inmails']
+    total_inmail_replies = totals['inmail_replies']
     
     # Calculate rates
     reply_rate = (total_replies / total_sent_messages * 100) if total_sent_messages > 0 else 0
@@ -35,12 +35,25 @@ class LinkedInDataProcessor:
         ]
         for col in numeric_cols:
             if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
+                values = pd.to_numeric(df[col], errors='coerce').fillna(0)
+                # Whole-number counters fit int32: half the bytes of int64/float64
+                if (values % 1 == 0).all():
+                    values = values.astype('int32')
+                df[col] = values
         
         # Date conversions
         if 'date' in df.columns:
             df['date'] = pd.to_datetime(df['date'], errors='coerce')
         
+        # One id dtype on both tables so the leads filter needs no per-run cast
+        if 'campaign_id' in df.columns:
+            df['campaign_id'] = df['campaign_id'].astype('string')
+        
+        # Filter and grouping columns: comparisons and groupbys use category codes
+        for col in ['workspace_name', 'campaign_name', 'outreach_type']:
+            if col in df.columns:
+                df[col] = df[col].astype('category')
+        
         return df
     
     @staticmethod
@@ -59,15 +72,26 @@ class LinkedInDataProcessor:
         
         df = pd.DataFrame(leads_data)
         
-        # Type conversions
+        # Type conversions: reply_date is parsed once here as naive UTC
+        # datetime64, so charts and date filters never re-parse it
         if 'reply_date' in df.columns:
-            df['reply_date'] = pd.to_datetime(df['reply_date'], errors='coerce')
+            df['reply_date'] = pd.to_datetime(df['reply_date'], errors='coerce', utc=True).dt.tz_localize(None)
         
         if 'createdTime' in df.columns:
             df['createdTime'] = pd.to_datetime(df['createdTime'], errors='coerce')
         
         # Numeric conversions
         if 'replies' in df.columns:
-            df['replies'] = pd.to_numeric(df['replies'], errors='coerce').fillna(0)
+            replies = pd.to_numeric(df['replies'], errors='coerce').fillna(0)
+            df['replies'] = replies.astype('int32') if (replies % 1 == 0).all() else replies
+        
+        # Same id dtype as LinkedIn campaigns (see process_campaigns)
+        if 'campaign_id' in df.columns:
+            df['campaign_id'] = df['campaign_id'].astype('string')
+        
+        # Few distinct labels: status counts and account groupbys use category codes
+        for col in ['Status', 'account_name']:
+            if col in df.columns:
+                df[col] = df[col].astype('category')
         
         return df
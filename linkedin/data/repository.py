@@ -7,11 +7,13 @@ using the unified database client and API layer.
 
 import pandas as pd
 import streamlit as st
-from typing import List, Dict
+from datetime import datetime
+from typing import List, Dict, Optional, Tuple
 
 from core.database import get_database_client
 from core.logger import logger
 from linkedin.data.processor import LinkedInDataProcessor
+from shared.date_utils import get_date_range, filter_dataframe_by_date
 import config
 
 
@@ -56,6 +58,60 @@ class LinkedInRepository:
             st.error(f"Failed to load leads: {str(e)}")
             return pd.DataFrame()
     
+    @st.cache_data(ttl=config.CACHE_TTL, show_spinner=False)
+    def get_filtered(
+        _self,
+        workspace: Optional[str],
+        campaign: Optional[str],
+        date_filter: str,
+        custom_start: Optional[datetime] = None,
+        custom_end: Optional[datetime] = None
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Fetch campaigns and replied leads narrowed to the dashboard filters.
+        
+        Cached on the scalar filter values, so returning to a previously
+        selected combination skips the filtering. The date range is resolved
+        here rather than passed in because open-ended ranges end at "now",
+        which would change the cache key on every rerun.
+        
+        Args:
+            workspace: Workspace name, or None for all workspaces
+            campaign: Campaign name, or None for all campaigns
+            date_filter: Reply date filter option (see get_date_range)
+            custom_start: Start date for "Custom Date Range"
+            custom_end: End date for "Custom Date Range"
+            
+        Returns:
+            Tuple of (campaigns, leads) DataFrames
+        """
+        campaigns_df = _self.get_campaigns()
+        leads_df = _self.get_leads()
+        
+        if workspace is not None:
+            campaigns_df = campaigns_df[campaigns_df['workspace_name'] == workspace]
+        if campaign is not None:
+            campaigns_df = campaigns_df[campaigns_df['campaign_name'] == campaign]
+        
+        # Leads of the remaining campaigns; campaign_id is a string column on
+        # both frames (LinkedInDataProcessor)
+        if not campaigns_df.empty:
+            valid_ids = set(campaigns_df['campaign_id'].dropna().unique())
+            leads_df = leads_df[leads_df['campaign_id'].isin(valid_ids)]
+        else:
+            leads_df = pd.DataFrame(columns=leads_df.columns)
+        
+        # Reply date range
+        if date_filter != "All Time" and not leads_df.empty and 'reply_date' in leads_df.columns:
+            start_date, end_date = get_date_range(date_filter, custom_start, custom_end)
+            leads_df = filter_dataframe_by_date(leads_df, 'reply_date', start_date, end_date)
+        
+        # Only leads that have replied
+        if not leads_df.empty and 'replies' in leads_df.columns:
+            leads_df = leads_df[leads_df['replies'] > 0]
+        
+        return campaigns_df, leads_df
+    
     @st.cache_data(ttl=config.CACHE_TTL)
     def get_accounts(_self) -> pd.DataFrame:
         """
@@ -65,9 +121,10 @@ class LinkedInRepository:
             DataFrame of accounts
         """
         try:
-            # The table name is linkedin_accounts from config
+            # The table name is linkedin_accounts from config; the dashboard
+            # only needs the ID and status to exclude deleted accounts
             accounts_table = config.LINKEDIN_ACCOUNTS_TABLE_NAME
-            data = _self.db.fetch_all(accounts_table)
+            data = _self.db.fetch_all(accounts_table, columns=('account_id', 'status'))
             
             if not data:
                 return pd.DataFrame()
@@ -89,14 +146,13 @@ class LinkedInRepository:
             True if successful, False otherwise
         """
         try:
-            # Delete associated leads first
-            self.db.delete_many(self.leads_table, {'campaign_id': campaign_id})
-            
-            # Delete the campaign
-            self.db.delete(self.campaigns_table, 'campaign_id', campaign_id)
+            # Delete the leads and the campaign together
+            self.db.delete_campaign_cascade(self.campaigns_table, self.leads_table, campaign_id)
             
-            # Clear cache
-            st.cache_data.clear()
+            # Clear only the LinkedIn data caches (not the persisted email loaders)
+            LinkedInRepository.get_campaigns.clear()
+            LinkedInRepository.get_leads.clear()
+            LinkedInRepository.get_filtered.clear()
             
             logger.info(f"Successfully deleted LinkedIn campaign {campaign_id}")
             return True
@@ -72,3 +72,47 @@ def calculate_reply_metrics(leads_df: pd.DataFrame, campaigns_df: pd.DataFrame =
         metrics['automated'] = len(replied_leads[replied_leads['Status'] == 'Automated Reply'])
     
     return metrics
+
+
+def build_aggregates(campaigns_df: pd.DataFrame, leads_df: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Compute the totals shared by the KPI cards, conversion funnel and lead
+    status analysis in one pass over the filtered data.
+    
+    Args:
+        campaigns_df: Filtered DataFrame of LinkedIn campaigns
+        leads_df: Filtered DataFrame of LinkedIn leads
+        
+    Returns:
+        Dictionary with:
+        - 'replied_count': number of replied leads
+        - 'status_counts': {status: count} of replied leads, statuses with
+          no leads omitted
+        - 'funnel_totals': {'sent', 'accepted', 'replies', 'interested'},
+          empty when there are no campaigns
+    """
+    replied_leads = get_replied_leads(leads_df)
+    replied_count = len(replied_leads)
+    
+    status_counts: Dict[str, int] = {}
+    if not replied_leads.empty and 'Status' in replied_leads.columns:
+        counts = replied_leads['Status'].value_counts()
+        # Status is categorical: drop categories absent after filtering
+        status_counts = {status: int(n) for status, n in counts.items() if n > 0}
+    
+    funnel_totals: Dict[str, int] = {}
+    if not campaigns_df.empty:
+        # One reduction over both columns instead of a sum() per column
+        sent, accepted = campaigns_df[['sent_connections', 'accepted_connections']].sum().tolist()
+        funnel_totals = {
+            'sent': int(sent),
+            'accepted': int(accepted),
+            'replies': replied_count,
+            'interested': status_counts.get('Interested', 0)
+        }
+    
+    return {
+        'replied_count': replied_count,
+        'status_counts': status_counts,
+        'funnel_totals': funnel_totals
+    }
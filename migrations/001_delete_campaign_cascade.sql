@@ -0,0 +1,40 @@
+-- Deletes a campaign and its leads in a single transaction.
+--
+-- Called from DatabaseClient.delete_campaign_cascade via supabase.rpc() for
+-- both the email and the LinkedIn campaigns. Table names are passed in
+-- because they are configured per deployment, so only the pairs listed
+-- below are accepted. Replace them with your CAMPAIGNS_TABLE_NAME /
+-- LEADS_TABLE_NAME and LINKEDIN_CAMPAIGN_TABLE_NAME /
+-- LINKEDIN_LEADS_TABLE_NAME if they differ.
+--
+-- Optional: when the function is missing the app falls back to deleting
+-- the leads and then the campaign with two requests.
+
+CREATE OR REPLACE FUNCTION delete_campaign_cascade(
+    p_campaigns_table text,
+    p_leads_table text,
+    p_campaign_id text
+)
+RETURNS void
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF (p_campaigns_table, p_leads_table) NOT IN (
+        ('campaign', 'leads'),
+        ('linkedin_campaign', 'linkedin_leads')
+    ) THEN
+        RAISE EXCEPTION 'delete_campaign_cascade: tables %/% not allowed',
+            p_campaigns_table, p_leads_table;
+    END IF;
+
+    EXECUTE format('DELETE FROM %I WHERE campaign_id::text = $1', p_leads_table)
+        USING p_campaign_id;
+    EXECUTE format('DELETE FROM %I WHERE campaign_id::text = $1', p_campaigns_table)
+        USING p_campaign_id;
+END;
+$$;
+
+-- Postgres grants EXECUTE to PUBLIC by default; only the app's service
+-- role may call this
+REVOKE EXECUTE ON FUNCTION delete_campaign_cascade(text, text, text) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION delete_campaign_cascade(text, text, text) TO service_role;
@@ -0,0 +1,11 @@
+-- One API key row per workspace.
+--
+-- Turns the workspace_id lookups from the API Config page into index probes
+-- and is the conflict target of the key form's upsert
+-- (DatabaseClient.upsert(..., on_conflict='workspace_id')).
+--
+-- Replace email_api_keys with your EMAIL_API_KEYS_TABLE_NAME if it differs.
+-- Remove any duplicate workspace_id rows before running this.
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_email_api_keys_workspace_id
+    ON email_api_keys (workspace_id);
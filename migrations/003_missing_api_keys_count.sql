@@ -0,0 +1,39 @@
+-- Counts workspaces that have campaigns but no usable API key.
+--
+-- Backs the sidebar "API Config" alert: one aggregate instead of shipping
+-- both the campaigns and the API keys tables to the app. Table names are
+-- passed in because they are configured per deployment
+-- (CAMPAIGNS_TABLE_NAME / EMAIL_API_KEYS_TABLE_NAME). Called from
+-- DatabaseClient.missing_api_keys_count via supabase.rpc().
+
+CREATE OR REPLACE FUNCTION missing_api_keys_count(
+    p_campaigns_table text,
+    p_keys_table text
+)
+RETURNS integer
+LANGUAGE plpgsql
+STABLE
+AS $$
+DECLARE
+    result integer;
+BEGIN
+    EXECUTE format(
+        'SELECT count(DISTINCT c.workspace_id::text)
+           FROM %I c
+           LEFT JOIN %I k
+             ON k.workspace_id::text = c.workspace_id::text
+            AND k.api_key IS NOT NULL
+            AND btrim(k.api_key::text) NOT IN (''{}'', '''', ''null'', ''None'')
+          WHERE c.workspace_id IS NOT NULL
+            AND lower(btrim(c.workspace_id::text)) NOT IN ('''', ''nan'', ''unknown'', ''none'')
+            AND k.workspace_id IS NULL',
+        p_campaigns_table, p_keys_table
+    ) INTO result;
+    RETURN result;
+END;
+$$;
+
+-- Postgres grants EXECUTE to PUBLIC by default; only the app's service
+-- role may call this
+REVOKE EXECUTE ON FUNCTION missing_api_keys_count(text, text) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION missing_api_keys_count(text, text) TO service_role;
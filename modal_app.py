@@ -89,6 +89,7 @@ def run():
         "--server.headless true "
         "--server.enableCORS false "
         "--server.enableXsrfProtection false "
+        "--server.enableWebsocketCompression true "
         "--server.fileWatcherType none"
     )
     subprocess.Popen(cmd, shell=True)
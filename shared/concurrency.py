@@ -0,0 +1,38 @@
+"""
+Concurrency helpers for Streamlit pages.
+
+Worker threads do not inherit the Streamlit script run context, so calls
+to st.* or cached functions from a plain thread lose session state and
+emit "missing ScriptRunContext" warnings. These helpers attach the
+caller's context to every worker.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List
+
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+
+def run_concurrently(*funcs: Callable[[], Any]) -> List[Any]:
+    """
+    Run independent zero-argument callables in parallel threads.
+    
+    Intended for I/O-bound work such as database round trips, where the
+    GIL is released while waiting on the socket.
+    
+    Args:
+        *funcs: Callables to run
+        
+    Returns:
+        Results in the same order as ``funcs``. The first exception raised
+        by any callable is re-raised.
+    """
+    ctx = get_script_run_ctx()
+    
+    def _run(func: Callable[[], Any]) -> Any:
+        add_script_run_ctx(ctx=ctx)
+        return func()
+    
+    with ThreadPoolExecutor(max_workers=max(len(funcs), 1)) as executor:
+        futures = [executor.submit(_run, func) for func in funcs]
+        return [future.result() for future in futures]
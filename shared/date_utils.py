@@ -89,9 +89,12 @@ def filter_dataframe_by_date(df: pd.DataFrame, date_column: str, start_date, end
     if df.empty or date_column not in df.columns:
         return df
     
-    # Ensure the date column is datetime
+    # Ensure the date column is datetime; work on a local series so the
+    # caller's frame is never mutated
+    dates = df[date_column]
     try:
-        df[date_column] = pd.to_datetime(df[date_column], errors='coerce')
+        if not pd.api.types.is_datetime64_any_dtype(dates):
+            dates = pd.to_datetime(dates, errors='coerce')
     except Exception:
         return df
     
@@ -102,9 +105,19 @@ def filter_dataframe_by_date(df: pd.DataFrame, date_column: str, start_date, end
     if hasattr(end_date, 'tzinfo') and end_date.tzinfo is not None:
         end_date = end_date.replace(tzinfo=None)
     
-    # Ensure the DataFrame column is also timezone-naive
-    if hasattr(df[date_column].dtype, 'tz') and df[date_column].dtype.tz is not None:
-        df[date_column] = df[date_column].dt.tz_localize(None)
+    # Ensure the date series is also timezone-naive
+    if hasattr(dates.dtype, 'tz') and dates.dtype.tz is not None:
+        dates = dates.dt.tz_localize(None)
     
-    mask = (df[date_column] >= start_date) & (df[date_column] <= end_date)
+    # Sorted column (e.g. processed email leads, NaT sorted last): binary
+    # search the bounds within the non-NaT prefix. NaT rows never match the
+    # range, so dropping them gives the same result as the mask.
+    n_valid = int(dates.notna().sum())
+    valid = dates.iloc[:n_valid]
+    if valid.notna().all() and valid.is_monotonic_increasing:
+        start_idx = valid.searchsorted(start_date, side='left')
+        end_idx = valid.searchsorted(end_date, side='right')
+        return df.iloc[start_idx:end_idx]
+    
+    mask = (dates >= start_date) & (dates <= end_date)
     return df.loc[mask]
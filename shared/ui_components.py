@@ -5,8 +5,27 @@ This module provides common UI components used across both
 email and LinkedIn dashboards.
 """
 
-import streamlit as st
 from pathlib import Path
+from typing import Optional
+
+import streamlit as st
+
+
+@st.cache_resource(show_spinner=False)
+def _read_css(css_path: str) -> Optional[str]:
+    """
+    Read a stylesheet once per process.
+
+    Args:
+        css_path: Absolute path to the CSS file
+
+    Returns:
+        File contents, or None if the file does not exist
+    """
+    path = Path(css_path)
+    if not path.exists():
+        return None
+    return path.read_text()
 
 
 def load_css(css_file: str = "assets/styles.css") -> None:
@@ -19,11 +38,10 @@ def load_css(css_file: str = "assets/styles.css") -> None:
     # Resolve relative to this file's parent (the project root),
     # so it works regardless of the working directory (e.g. on Modal).
     project_root = Path(__file__).parent.parent
-    css_path = project_root / css_file
+    css = _read_css(str(project_root / css_file))
 
-    if css_path.exists():
-        with open(css_path) as f:
-            st.markdown(f"<style>{f.read()}</style>", unsafe_allow_html=True)
+    if css is not None:
+        st.markdown(f"<style>{css}</style>", unsafe_allow_html=True)
     else:
         st.warning(f"CSS file not found: {css_file}")
 
@@ -38,51 +56,7 @@ def render_platform_selector(show_api_alert: bool = False) -> str:
     Returns:
         Selected platform ("📧 Email" or "🔗 LinkedIn")
     """
-    st.markdown("""
-    <style>
-    /* Segmented Control Styling */
-    div[data-testid="stRadio"][data-baseweb="radio"] > div {
-        background-color: rgba(255, 255, 255, 0.1);
-        border-radius: 12px;
-        padding: 4px;
-        gap: 4px;
-    }
-    
-    div[data-testid="stRadio"] > div > label {
-        background-color: transparent;
-        border-radius: 8px;
-        padding: 12px 20px;
-        cursor: pointer;
-        transition: all 0.3s ease;
-        color: rgba(255, 255, 255, 0.7);
-        font-weight: 600;
-        text-align: center;
-        border: none;
-        margin: 0;
-    }
-    
-    div[data-testid="stRadio"] > div > label:hover {
-        background-color: rgba(255, 255, 255, 0.15);
-        color: white;
-    }
-    
-    div[data-testid="stRadio"] > div > label[data-baseweb="radio"] > div:first-child {
-        display: none;
-    }
-    
-    /* Active state */
-    div[data-testid="stRadio"] label:has(input:checked) {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        box-shadow: 0 4px 12px rgba(102, 126, 234, 0.4);
-    }
-    
-    div[data-testid="stRadio"] label:has(input:checked) p {
-        color: white !important;
-    }
-    </style>
-    """, unsafe_allow_html=True)
-    
+    # Segmented control styling lives in assets/styles.css
     st.markdown("""
     <div style='text-align: center; margin-bottom: 20px;'>
         <h2 style='color: white; margin: 0; font-size: 1.8em;'>🚀 Dashboard</h2>